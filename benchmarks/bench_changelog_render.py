@@ -0,0 +1,61 @@
+import os
+import tempfile
+import time
+import tracemalloc
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.history import History
+from pyhist.io.changelog_generator import ChangelogGenerator
+from pyhist.versioning.version import Version
+
+SIZES = [100_000, 1_000_000]
+COMMITS_PER_VERSION = 50
+
+
+def build_history(size: int) -> History:
+    history = History()
+    for index in range(size):
+        if index % COMMITS_PER_VERSION == 0:
+            history.add_version(Version().create_from_version_parts(0, index, 0))
+        else:
+            history.add_commit(
+                CommitRecord(
+                    hexsha=f"{index:040x}",
+                    message=f"fix: commit {index}\n",
+                    committed_date=1600000000 + index,
+                    committer_tz_offset=0,
+                )
+            )
+
+    return history
+
+
+def bench(size: int):
+    history = build_history(size)
+    generator = ChangelogGenerator(history)
+    # Materialize the view up front so only rendering is measured
+    history.pyhist_items
+
+    start = time.perf_counter()
+    generator.generate_changelog(incremental=False)
+    elapsed = time.perf_counter() - start
+
+    # Tracing slows rendering down, so memory is measured on a second run
+    tracemalloc.start()
+    generator.generate_changelog(incremental=False)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak, os.path.getsize("CHANGELOG.md")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        for size in SIZES:
+            elapsed, peak, file_size = bench(size)
+            print(
+                f"{size:>9} entries: {elapsed * 1000:.0f}ms, "
+                f"{file_size / 2 ** 20:.1f}MB written, "
+                f"{peak / 2 ** 10:.0f}KB peak rendering memory"
+            )
@@ -0,0 +1,36 @@
+import tracemalloc
+
+from pyhist.history.commit_record import CommitRecord
+
+SIZE = 300_000
+
+
+def bench(size: int) -> float:
+    # Message text and the list holding the records are not per-record overhead.
+    # The list is allocated before measuring, and the message bytes copied into
+    # the records are subtracted
+    hexshas = [f"{index:040x}" for index in range(size)]
+    messages = [f"fix: commit {index}\n" for index in range(size)]
+    message_size = sum(len(message.encode("utf-8")) for message in messages)
+    records = [None] * size
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for index in range(size):
+        records[index] = CommitRecord(
+            hexsha=hexshas[index],
+            message=messages[index],
+            committed_date=1600000000 + index,
+            committer_tz_offset=-7200,
+        )
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(records) == size
+    return (after - before - message_size) / size
+
+
+if __name__ == "__main__":
+    per_record = bench(SIZE)
+    print(f"{SIZE} commit records: {per_record:.1f} bytes/record")
+    assert per_record < 100, "commit records must stay below 100 bytes each"
@@ -0,0 +1,60 @@
+import time
+from unittest.mock import MagicMock
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.git_history import GitHistory
+from pyhist.history.history import History
+from pyhist.history.pyhist_item import PyHistItem
+from pyhist.pyhist import PyHist
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def build_commits(start: int, end: int):
+    return [
+        CommitRecord(
+            hexsha=f"{index:040x}",
+            message=f"fix: commit {index}\n",
+            committed_date=1600000000 + index,
+            committer_tz_offset=0,
+        )
+        for index in range(start, end)
+    ]
+
+
+def bench(size: int) -> float:
+    # 1% of the history has been rewritten: as many commits removed as added
+    changed = size // 100
+    pyhist_commits = build_commits(0, size)
+    git_commits = pyhist_commits[changed:] + build_commits(size, size + changed)
+
+    git_history = GitHistory()
+    git_history.git_commits = git_commits
+    history = History()
+    history.pyhist_items = [
+        PyHistItem(commit=commit, version=None, is_version=False)
+        for commit in pyhist_commits
+    ]
+    pyhist = PyHist(
+        git_history=git_history,
+        history=history,
+        semantic_versioning=MagicMock(),
+        changelog_generator=MagicMock(),
+        setup_parser=MagicMock(),
+    )
+
+    start = time.perf_counter()
+    added_commits = pyhist._get_added_commits()
+    removed_commits = pyhist._get_removed_commits()
+    elapsed = time.perf_counter() - start
+
+    assert len(added_commits) == len(removed_commits) == changed
+    return elapsed
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        elapsed = bench(size)
+        print(
+            f"{size:>9} commits: {elapsed:.3f}s ({elapsed / size * 1e9:.0f} ns/commit)"
+        )
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import time
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.history import History
+from pyhist.history.history_file import HistoryFile
+from pyhist.versioning.version import Version
+
+SIZES = [100_000, 1_000_000]
+LOOKUPS = 100
+
+
+def build_history(size: int) -> History:
+    history = History()
+    for index in range(size):
+        history.add_commit(
+            CommitRecord(
+                hexsha=f"{index:040x}",
+                message=f"fix: commit {index}\n",
+                committed_date=1600000000 + index,
+                committer_tz_offset=0,
+            )
+        )
+    history.add_version(Version().create_from_version_parts(1, 0, 0))
+
+    return history
+
+
+def bench(size: int):
+    build_history(size).save_history()
+
+    start = time.perf_counter()
+    HistoryFile(".pyhist").read()
+    eager = time.perf_counter() - start
+
+    # What --update needs before any change: head, last version, known shas
+    start = time.perf_counter()
+    history = History()
+    history.load_history()
+    history.get_head_commit_id()
+    history.get_last_version()
+    for index in range(0, size, size // LOOKUPS):
+        history.has_commit(f"{index:040x}")
+    lazy = time.perf_counter() - start
+
+    return eager, lazy
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        for size in SIZES:
+            eager, lazy = bench(size)
+            print(
+                f"{size:>9} items: full read {eager * 1000:.0f}ms, "
+                f"mapped load and {LOOKUPS} lookups {lazy * 1000:.2f}ms"
+            )
@@ -0,0 +1,33 @@
+import random
+import time
+
+from pyhist.history.git_history import GitHistory
+from pyhist.history.history import History
+from pyhist.versioning.commit_type import CommitType
+from pyhist.versioning.semantic_versioning import SemanticVersioning
+from pyhist.versioning.version import Version
+
+SIZES = [1_000_000, 5_000_000]
+
+
+def bench(size: int) -> float:
+    rng = random.Random(size)
+    type_codes = [0] + [commit_type.code for commit_type in CommitType]
+    added_codes = bytes(rng.choice(type_codes) for _ in range(size))
+    removed_codes = bytes(rng.choice(type_codes) for _ in range(size // 10))
+
+    history = History()
+    history.add_version(Version().create_from_str_version("1.0.0"))
+    semantic_versioning = SemanticVersioning(git_history=GitHistory(), history=history)
+    semantic_versioning.version = Version().create_from_str_version("1.2.3")
+
+    start = time.perf_counter()
+    semantic_versioning.update_version_from_codes(
+        added_codes=added_codes, removed_codes=removed_codes
+    )
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        print(f"{size:>9} commits: {bench(size) * 1000:.1f}ms")
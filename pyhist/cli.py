@@ -1,22 +1,102 @@
-import click
+import sys
+from typing import Tuple
 
-from pyhist.pyhist import PyHist
-from pyhist.history import GitHistory, History
-from pyhist.io.changelog_generator import ChangelogGenerator
-from pyhist.io.setup_parser import SetupParser
-from pyhist.versioning.semantic_versioning import SemanticVersioning
+import click
 
 
 @click.command()
 @click.option("--init", is_flag=True, help="")
 @click.option("--update", is_flag=True, help="")
 @click.option("--major", is_flag=True, help="")
-def main(init: bool, update: bool, major: bool):
-    git_history = GitHistory()
-    history = History()
-    version_parser = SetupParser()
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Exit with 1 if there are commits to release, 0 otherwise",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Print the next version and changelog changes without applying them",
+)
+@click.option(
+    "--monorepo",
+    is_flag=True,
+    help="Release every package of the repository in a single versioning commit",
+)
+@click.option(
+    "--async-git",
+    is_flag=True,
+    help="Run git queries concurrently in asyncio subprocesses",
+)
+@click.option(
+    "--fast-commit",
+    is_flag=True,
+    help="Create versioning commits with plumbing commands, without running hooks",
+)
+@click.option(
+    "--include",
+    multiple=True,
+    help="Only compute versions from commits changing paths matching this pattern",
+)
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="Ignore commits that only change paths matching this pattern",
+)
+def main(
+    init: bool,
+    update: bool,
+    major: bool,
+    check: bool,
+    dry_run: bool,
+    monorepo: bool,
+    async_git: bool,
+    fast_commit: bool,
+    include: Tuple[str, ...],
+    exclude: Tuple[str, ...],
+):
+    if not (init or update or major or check):
+        return
+    if check and monorepo:
+        raise click.UsageError("--check does not support --monorepo")
+
+    # Imported here, so --help and no-op runs do not load GitPython
+    from pyhist.pyhist import PyHist
+    from pyhist.history import GitHistory, History
+    from pyhist.history.path_filter import PathFilter
+    from pyhist.io.atomic_writer import AtomicWriter
+    from pyhist.io.capturing_writer import CapturingWriter
+    from pyhist.io.changelog_generator import ChangelogGenerator
+    from pyhist.io.version_parsers import VersionParsers
+    from pyhist.versioning.semantic_versioning import SemanticVersioning
+
+    writer = CapturingWriter() if dry_run else AtomicWriter()
+    path_filter = None
+    if include or exclude:
+        path_filter = PathFilter(include=list(include), exclude=list(exclude))
+    if async_git:
+        from pyhist.history.async_git_history import AsyncGitHistory
+
+        git_history = AsyncGitHistory(path_filter=path_filter, fast_commit=fast_commit)
+    else:
+        git_history = GitHistory(path_filter=path_filter, fast_commit=fast_commit)
+
+    if monorepo:
+        from pyhist.monorepo import MonoRepo
+
+        pyhist = MonoRepo(git_history=git_history, writer=writer, dry_run=dry_run)
+        if init:
+            pyhist.setup()
+        elif update:
+            pyhist.update()
+        elif major:
+            pyhist.major()
+        return
+
+    history = History(writer=writer)
+    version_parser = VersionParsers(writer=writer)
     semantic_versioning = SemanticVersioning(git_history=git_history, history=history)
-    changelog_generator = ChangelogGenerator(history=history)
+    changelog_generator = ChangelogGenerator(history=history, writer=writer)
 
     pyhist = PyHist(
         git_history=git_history,
@@ -24,6 +104,8 @@ def main(init: bool, update: bool, major: bool):
         semantic_versioning=semantic_versioning,
         changelog_generator=changelog_generator,
         setup_parser=version_parser,
+        writer=writer,
+        dry_run=dry_run,
     )
 
     if init:
@@ -32,3 +114,5 @@ def main(init: bool, update: bool, major: bool):
         pyhist.update()
     elif major:
         pyhist.major()
+    elif check:
+        sys.exit(1 if pyhist.check() else 0)
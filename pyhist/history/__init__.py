@@ -1,2 +1,4 @@
 from .history import History
 from .git_history import GitHistory
+
+__all__ = ["History", "GitHistory"]
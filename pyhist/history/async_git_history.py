@@ -0,0 +1,193 @@
+import asyncio
+import os
+import queue
+from typing import List, Optional, Tuple
+
+from git import GitCommandError
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.git_history import GitHistory
+from pyhist.history.history_exception import HistoryException
+from pyhist.history.path_filter import PathFilter
+
+
+class AsyncGitHistory(GitHistory):
+    # Runs git in asyncio subprocesses, so independent queries run concurrently
+    # and the history can be walked while other files are read
+    LOG_QUEUE_SIZE = 16
+
+    def __init__(
+        self, path_filter: Optional[PathFilter] = None, fast_commit: bool = False
+    ):
+        super().__init__(path_filter=path_filter, fast_commit=fast_commit)
+        self.__since_commit_id: Optional[str] = None
+
+    def load_history(
+        self, since_commit_id: Optional[str] = None, with_paths: bool = False
+    ) -> None:
+        asyncio.run(
+            self.load_history_async(
+                since_commit_id=since_commit_id, with_paths=with_paths
+            )
+        )
+
+    async def load_history_async(
+        self, since_commit_id: Optional[str] = None, with_paths: bool = False
+    ) -> None:
+        self.__since_commit_id = None
+        try:
+            self.git_commits = await self._get_commits_async(
+                since_commit_id=since_commit_id, with_paths=with_paths
+            )
+        except Exception as e:
+            raise HistoryException("Error loading git history", e)
+
+    def is_incremental(self) -> bool:
+        return self.__since_commit_id is not None
+
+    def commit_files(self, files: List[str], message: str) -> None:
+        asyncio.run(self.commit_files_async(files=files, message=message))
+
+    async def commit_files_async(self, files: List[str], message: str) -> None:
+        untracked_files = await self._get_untracked_files_async(files)
+
+        changed_files = [file for file in files if file in untracked_files]
+        if not changed_files:
+            return
+
+        if self.fast_commit:
+            await self._commit_with_plumbing_async(files=changed_files, message=message)
+        else:
+            await self._run_git("add", "--", *changed_files)
+            await self._run_git("commit", "-m", message)
+
+    async def _commit_with_plumbing_async(self, files: List[str], message: str) -> None:
+        # The parent is resolved while the blobs are written
+        existing_files = [file for file in files if os.path.exists(file)]
+        (ref, parent), blobs = await asyncio.gather(
+            self._get_ref_async(), self._hash_objects_async(existing_files)
+        )
+
+        await self._run_git(
+            "update-index", *self._get_index_updates(files, existing_files, blobs)
+        )
+        tree = (await self._run_git("write-tree")).decode("utf-8").strip()
+        commit = await self._run_git(
+            "commit-tree", tree, *self._get_commit_options(parent, message)
+        )
+        await self._run_git(
+            "update-ref",
+            *self._get_ref_update(ref, commit.decode("utf-8").strip(), parent, message),
+        )
+
+    async def _get_ref_async(self) -> Tuple[str, Optional[str]]:
+        try:
+            ref = (await self._run_git("symbolic-ref", "HEAD")).decode("utf-8").strip()
+        except GitCommandError:
+            ref = "HEAD"
+        try:
+            parent = await self._run_git("rev-parse", "--verify", "--quiet", ref)
+            return ref, parent.decode("utf-8").strip()
+        except GitCommandError:
+            return ref, None
+
+    async def _hash_objects_async(self, files: List[str]) -> List[str]:
+        if not files:
+            return []
+
+        blobs = await self._run_git("hash-object", "-w", "--", *files)
+        return blobs.decode("utf-8").split()
+
+    async def _get_commits_async(
+        self, since_commit_id: Optional[str] = None, with_paths: bool = False
+    ) -> List[CommitRecord]:
+        try:
+            output = await self._run_git("symbolic-ref", "--short", "HEAD")
+            branch = output.decode("utf-8").strip()
+            if since_commit_id is None:
+                return await self._log(branch, with_paths)
+
+            # The new commits are walked while their base is checked, and only
+            # walked again from the start if the base is no longer in the branch
+            is_ancestor, commits = await asyncio.gather(
+                self._is_ancestor_async(since_commit_id, branch),
+                self._log(f"{since_commit_id}..{branch}", with_paths),
+                return_exceptions=True,
+            )
+            if is_ancestor is True and not isinstance(commits, Exception):
+                self.__since_commit_id = since_commit_id
+                return commits
+
+            return await self._log(branch, with_paths)
+        except GitCommandError:
+            return []
+
+    async def _log(self, revision: str, with_paths: bool) -> List[CommitRecord]:
+        with_paths = self._uses_paths(with_paths)
+        args = ["log", revision, *self._get_log_options(with_paths)]
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        # The output is parsed in a thread as it is read, so the whole log is never
+        # held in memory. An empty chunk ends the parse
+        loop = asyncio.get_running_loop()
+        chunks: "queue.Queue[bytes]" = queue.Queue(maxsize=self.LOG_QUEUE_SIZE)
+        parse = loop.run_in_executor(
+            None,
+            lambda: list(
+                self._filter_commits(self._parse_log(iter(chunks.get, b""), with_paths))
+            ),
+        )
+        try:
+            chunk = await process.stdout.read(self.LOG_CHUNK_SIZE)
+            while chunk:
+                if chunks.full():
+                    # Reading waits for the parse to catch up
+                    await loop.run_in_executor(None, chunks.put, chunk)
+                else:
+                    chunks.put_nowait(chunk)
+                chunk = await process.stdout.read(self.LOG_CHUNK_SIZE)
+        finally:
+            await loop.run_in_executor(None, chunks.put, b"")
+
+        stderr = await process.stderr.read()
+        commits = await parse
+        if await process.wait() != 0:
+            raise GitCommandError(["git", *args], process.returncode, stderr)
+
+        return commits
+
+    async def _is_ancestor_async(self, commit_id: str, branch: str) -> bool:
+        try:
+            await self._run_git("merge-base", "--is-ancestor", commit_id, branch)
+            return True
+        except GitCommandError:
+            return False
+
+    def _get_untracked_files(self, files: List[str]) -> List[str]:
+        return asyncio.run(self._get_untracked_files_async(files))
+
+    async def _get_untracked_files_async(self, files: List[str]) -> List[str]:
+        if not files:
+            return []
+
+        status = await self._run_git("status", *self.STATUS_OPTIONS, "--", *files)
+        return self._parse_status(status)
+
+    @classmethod
+    async def _run_git(cls, *args: str) -> bytes:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise GitCommandError(["git", *args], process.returncode, stderr)
+
+        return stdout
@@ -0,0 +1,203 @@
+import mmap
+import struct
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+from pyhist.io.atomic_writer import AtomicWriter
+
+VersionParts = Tuple[int, int, int]
+
+
+class CacheEntry(NamedTuple):
+    type_code: int
+    version: Optional[VersionParts]
+    committed_date: int
+
+
+class CommitCache:
+    # Maps commit shas to what pyhist derives from their messages. The file holds
+    # records sorted by binsha, searched in place over a memory map, followed by
+    # the records appended by later runs. Once the appended records grow too
+    # many, the file is rewritten sorted, keeping the newest commits
+    MAGIC = b"PYHCCH"
+    SCHEMA_VERSION = 2
+    # magic, schema version and number of sorted records
+    HEADER = struct.Struct("<6sHI")
+    # binsha, type code, committed date and version parts (-1 when no version)
+    RECORD = struct.Struct("<20sBqiii")
+    NO_VERSION = (-1, -1, -1)
+    MIN_APPENDED_RECORDS = 1024
+
+    def __init__(self, route: str, max_entries: int = 250_000):
+        self.route = route
+        self.max_entries = max_entries
+        self.__content: Optional[mmap.mmap] = None
+        self.__sorted_count = 0
+        # End of the last whole record, where the next records are appended
+        self.__records_end = 0
+        self.__appended_entries: Dict[bytes, CacheEntry] = {}
+        self.__new_entries: Dict[bytes, CacheEntry] = {}
+        self.__is_loaded = False
+
+    def get(self, binsha: bytes, committed_date: int) -> Optional[CacheEntry]:
+        self._load()
+
+        entry = self.__new_entries.get(binsha)
+        if entry is None:
+            entry = self.__appended_entries.get(binsha)
+        if entry is None:
+            entry = self._find_sorted(binsha)
+        if entry is None or entry.committed_date != committed_date:
+            return None
+
+        return entry
+
+    def put(self, binsha: bytes, entry: CacheEntry) -> None:
+        self._load()
+        self.__new_entries[binsha] = entry
+
+    def save(self) -> None:
+        if not self.__new_entries:
+            return
+
+        self._load()
+        appended_count = len(self.__appended_entries) + len(self.__new_entries)
+        if self.__content is not None and appended_count <= max(
+            self.MIN_APPENDED_RECORDS, self.__sorted_count // 8
+        ):
+            # A record left half written by a failed append is overwritten
+            records = self._encode_records(self.__new_entries)
+            with open(self.route, "r+b") as file:
+                file.seek(self.__records_end)
+                file.write(records)
+                file.truncate()
+            self.__records_end += len(records)
+        else:
+            self._rewrite()
+
+        self.__appended_entries.update(self.__new_entries)
+        self.__new_entries = {}
+
+    def close(self) -> None:
+        if self.__content is not None:
+            self.__content.close()
+            self.__content = None
+
+    def _rewrite(self) -> None:
+        entries = dict(
+            self._decode_record(record) for record in self._iter_sorted_records()
+        )
+        entries.update(self.__appended_entries)
+        entries.update(self.__new_entries)
+        if len(entries) > self.max_entries:
+            binshas = sorted(entries, key=lambda binsha: entries[binsha].committed_date)
+            for binsha in binshas[: len(entries) - self.max_entries]:
+                del entries[binsha]
+
+        self.close()
+        with AtomicWriter().open(self.route, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.SCHEMA_VERSION, len(entries)))
+            file.write(
+                self._encode_records(
+                    {binsha: entries[binsha] for binsha in sorted(entries)}
+                )
+            )
+
+        self.__sorted_count = 0
+        self.__appended_entries = {}
+        self._open()
+
+    def _load(self) -> None:
+        # Opened on first use. A missing, corrupt or outdated cache starts empty
+        if self.__is_loaded:
+            return
+
+        self.__is_loaded = True
+        self._open()
+
+    def _open(self) -> None:
+        try:
+            with open(self.route, "rb") as file:
+                content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+
+        if len(content) < self.HEADER.size:
+            content.close()
+            return
+
+        magic, schema_version, sorted_count = self.HEADER.unpack_from(content)
+        sorted_end = self.HEADER.size + sorted_count * self.RECORD.size
+        if (
+            magic != self.MAGIC
+            or schema_version != self.SCHEMA_VERSION
+            or len(content) < sorted_end
+        ):
+            content.close()
+            return
+
+        self.__content = content
+        self.__sorted_count = sorted_count
+        appended_count = (len(content) - sorted_end) // self.RECORD.size
+        self.__records_end = sorted_end + appended_count * self.RECORD.size
+        self.__appended_entries = dict(
+            self._decode_record(record)
+            for record in self.RECORD.iter_unpack(
+                content[sorted_end : self.__records_end]
+            )
+        )
+
+    def _find_sorted(self, binsha: bytes) -> Optional[CacheEntry]:
+        if self.__content is None:
+            return None
+
+        low, high = 0, self.__sorted_count
+        while low < high:
+            middle = (low + high) // 2
+            record_start = self.HEADER.size + middle * self.RECORD.size
+            if self.__content[record_start : record_start + 20] < binsha:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self.__sorted_count:
+            return None
+
+        record = self.RECORD.unpack_from(
+            self.__content, self.HEADER.size + low * self.RECORD.size
+        )
+        return self._decode_record(record)[1] if record[0] == binsha else None
+
+    def _iter_sorted_records(self) -> Iterator[tuple]:
+        if self.__content is None:
+            return iter(())
+
+        return self.RECORD.iter_unpack(
+            self.__content[
+                self.HEADER.size : self.HEADER.size
+                + self.__sorted_count * self.RECORD.size
+            ]
+        )
+
+    @classmethod
+    def _decode_record(cls, record: tuple) -> Tuple[bytes, CacheEntry]:
+        binsha, type_code, committed_date, *version = record
+        return (
+            binsha,
+            CacheEntry(
+                type_code=type_code,
+                version=tuple(version) if version[0] >= 0 else None,
+                committed_date=committed_date,
+            ),
+        )
+
+    @classmethod
+    def _encode_records(cls, entries: Dict[bytes, CacheEntry]) -> bytes:
+        return b"".join(
+            cls.RECORD.pack(
+                binsha,
+                entry.type_code,
+                entry.committed_date,
+                *(entry.version or cls.NO_VERSION),
+            )
+            for binsha, entry in entries.items()
+        )
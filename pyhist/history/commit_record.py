@@ -0,0 +1,120 @@
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+
+from pyhist.versioning.commit_classifier import COMMIT_CLASSIFIER
+from pyhist.versioning.commit_type import CommitType
+
+if TYPE_CHECKING:
+    from git import Commit
+
+
+class CommitRecord(bytes):
+    # binsha, committed date, tz offset and commit type code, followed by the
+    # utf-8 message. All of them are packed into the bytes value itself, so a
+    # record carries no per-field objects and is freed along with its message
+    __slots__ = ()
+
+    LAYOUT = struct.Struct("<20sqiB")
+    TYPE_CODE_OFFSET = 32
+
+    def __new__(
+        cls,
+        hexsha: str,
+        message: str,
+        committed_date: int,
+        committer_tz_offset: int,
+        type_code: Optional[int] = None,
+    ) -> "CommitRecord":
+        binsha = bytes.fromhex(hexsha)
+        if type_code is None:
+            type_code = COMMIT_CLASSIFIER.get_type_code(message)
+
+        return super().__new__(
+            cls,
+            cls.LAYOUT.pack(binsha, committed_date, committer_tz_offset, type_code)
+            + message.encode("utf-8"),
+        )
+
+    def __reduce__(self):
+        # Records are rebuilt from their fields, as __new__ does not take bytes
+        return (
+            CommitRecord,
+            (
+                self.hexsha,
+                self.message,
+                self.committed_date,
+                self.committer_tz_offset,
+                self.type_code,
+            ),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CommitRecord):
+            return NotImplemented
+
+        return bytes.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        return bytes.__hash__(self)
+
+    def __repr__(self) -> str:
+        return f"CommitRecord(hexsha={self.hexsha!r}, subject={self.subject!r})"
+
+    __str__ = __repr__
+
+    @property
+    def binsha(self) -> bytes:
+        return self[:20]
+
+    @property
+    def hexsha(self) -> str:
+        return self[:20].hex()
+
+    @property
+    def committed_date(self) -> int:
+        return self.LAYOUT.unpack_from(self)[1]
+
+    @property
+    def committer_tz_offset(self) -> int:
+        return self.LAYOUT.unpack_from(self)[2]
+
+    @property
+    def type_code(self) -> int:
+        return self[self.TYPE_CODE_OFFSET]
+
+    @property
+    def commit_type(self) -> Optional[CommitType]:
+        return CommitType.from_code(self.type_code)
+
+    @property
+    def message(self) -> str:
+        return self[self.LAYOUT.size :].decode("utf-8")
+
+    @property
+    def subject(self) -> str:
+        return self.message.split("\n", 1)[0]
+
+    @property
+    def body(self) -> str:
+        parts = self.message.split("\n", 1)
+        return parts[1].strip("\n") if len(parts) > 1 else ""
+
+    @property
+    def committed_datetime(self) -> datetime:
+        # Git stores the offset in seconds west of UTC
+        tz = timezone(timedelta(seconds=-self.committer_tz_offset))
+        return datetime.fromtimestamp(self.committed_date, tz)
+
+    @classmethod
+    def from_commit(cls, commit: "Commit") -> "CommitRecord":
+        return cls(
+            hexsha=commit.hexsha,
+            message=commit.message,
+            committed_date=commit.committed_date,
+            committer_tz_offset=commit.committer_tz_offset,
+        )
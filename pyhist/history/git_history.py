@@ -1,67 +1,359 @@
+import asyncio
 import os
-from typing import List
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from git import Commit, Repo, GitCommandError, Diff
+from git import Repo, GitCommandError
 from gitdb.exc import BadName
 
+from pyhist.history.commit_cache import CacheEntry, CommitCache
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.path_filter import PathFilter
+from pyhist.versioning.commit_classifier import COMMIT_CLASSIFIER
+from pyhist.versioning.commit_type import CommitType
+
 
 class GitHistory:
-    def __init__(self):
+    LOG_CHUNK_SIZE = 1 << 16
+    STATUS_OPTIONS = ["--porcelain=v2", "-z", "--untracked-files=all"]
+    # Fields before the path of ordinary, renamed and unmerged status entries
+    STATUS_FIELDS = {b"1": 8, b"2": 9, b"u": 10}
+
+    def __init__(
+        self, path_filter: Optional[PathFilter] = None, fast_commit: bool = False
+    ):
         self.__root = ".git"
         self.__setup_file = "setup.py"
         self.__changelog_file = "CHANGELOG.md"
         self.__pyhist_file = ".pyhist"
         self.__repo: Repo = None
-        self.git_commits: List[Commit] = []
+        self.__since_commit_id: Optional[str] = None
+        # Newest commit of the last walk, before any path filter
+        self.__head_commit_id: Optional[str] = None
+        # Hash, raw committer date and raw message of each commit
+        self.__log_format = "%H%x1f%cd%x1f%B"
+        self.git_commits: List[CommitRecord] = []
+        # Paths changed by each commit, only when the history is loaded with them
+        self.__commit_paths: Dict[str, Tuple[str, ...]] = {}
+        # Only the commits changing the filtered paths are loaded
+        self.__path_filter = path_filter
+        self.commit_cache = CommitCache(os.path.join(self.__root, "pyhist-cache"))
+        # Versioning commits are created with plumbing commands, without hooks
+        self.fast_commit = fast_commit
 
     def has_git_support(self) -> bool:
         return os.path.exists(self.__root)
 
-    def load_history(self) -> None:
+    def load_history(
+        self, since_commit_id: Optional[str] = None, with_paths: bool = False
+    ) -> None:
         try:
             self.__repo = Repo(self.__root)
-            self.git_commits = self._get_commits()
+            self.__since_commit_id = None
+            self.__head_commit_id = None
+            self.git_commits = self._get_commits(
+                since_commit_id=since_commit_id, with_paths=with_paths
+            )
         except Exception as e:
             print(e)  # TODO: use logger
 
+    async def load_history_async(
+        self, since_commit_id: Optional[str] = None, with_paths: bool = False
+    ) -> None:
+        # GitPython blocks, so the walk runs in a thread of the running loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.load_history, since_commit_id, with_paths)
+        )
+
+    def get_head_commit_id(self) -> Optional[str]:
+        return self.__head_commit_id
+
+    def get_commit_paths(self, commit_id: str) -> Tuple[str, ...]:
+        return self.__commit_paths.get(commit_id, ())
+
+    def get_common_ancestor(self, commit_ids: List[Optional[str]]) -> Optional[str]:
+        # Newest commit that all the given ones descend from. None when any of them
+        # is missing or no longer in the branch, so the whole branch is walked
+        self.__repo = Repo(self.__root)
+        if not commit_ids or None in commit_ids:
+            return None
+        if not all(self._is_ancestor(commit_id, "HEAD") for commit_id in commit_ids):
+            return None
+
+        try:
+            return self.__repo.git.merge_base("--octopus", *commit_ids) or None
+        except GitCommandError:
+            return None
+
+    def count_commits_since(self, commit_id: Optional[str]) -> Optional[int]:
+        # Counts the non-versioning commits after commit_id without building the
+        # history. None means that commit_id is no longer in the branch
+        self.__repo = Repo(self.__root)
+        try:
+            head = self.__repo.head.commit.hexsha
+        except ValueError:
+            return 0
+
+        if commit_id == head:
+            return 0
+        if commit_id is None:
+            revision = head
+        elif self._is_ancestor(commit_id, head):
+            revision = f"{commit_id}..{head}"
+        else:
+            return None
+
+        if self.__path_filter is not None:
+            return sum(
+                commit.commit_type is not CommitType.Versioning
+                for commit in self._iter_commits(revision)
+            )
+
+        subjects = self.__repo.git.log(revision, "--format=%s").splitlines()
+        return sum(
+            COMMIT_CLASSIFIER.get_commit_type(subject) is not CommitType.Versioning
+            for subject in subjects
+        )
+
+    def is_incremental(self) -> bool:
+        return self.__since_commit_id is not None
+
+    def save_commit_cache(self) -> None:
+        if not self.has_git_support():
+            return
+
+        try:
+            self.commit_cache.save()
+        except OSError:
+            # The cache only saves work, so failing to persist it is not an error
+            pass
+
     def get_commit_ids(self) -> List[str]:
         return [commit.hexsha for commit in self.git_commits]
 
-    def add_versioning_commit(self, version: str) -> None:
-        untracked_files = self._get_untracked_files()
+    def add_versioning_commit(
+        self, version: str, files: Optional[List[str]] = None
+    ) -> None:
+        # files holds the version files, setup.py unless stated otherwise
+        versioning_files = [self.__changelog_file, self.__pyhist_file] + (
+            files if files is not None else [self.__setup_file]
+        )
+        self.commit_files(
+            files=versioning_files, message=f"versioning: Set version to {version}"
+        )
 
-        if (
-            self.__changelog_file in untracked_files
-            or self.__setup_file in untracked_files
-            or self.__pyhist_file in untracked_files
-        ):
+    def commit_files(self, files: List[str], message: str) -> None:
+        # Only the files with changes are committed
+        untracked_files = self._get_untracked_files(files)
 
-            if self.__setup_file in untracked_files:
-                self.__repo.index.add(self.__setup_file)
-            if self.__changelog_file in untracked_files:
-                self.__repo.index.add(self.__changelog_file)
-            if self.__pyhist_file in untracked_files:
-                self.__repo.index.add(self.__pyhist_file)
+        changed_files = [file for file in files if file in untracked_files]
+        if not changed_files:
+            return
 
-            self.__repo.git.commit("-m", f"versioning: Set version to {version}")
+        if self.fast_commit:
+            self._commit_with_plumbing(files=changed_files, message=message)
+        else:
+            self.__repo.index.add(changed_files)
+            self.__repo.git.commit("-m", message)
 
     def add_initial_commit(self, version: str) -> None:
-        untracked_files = self._get_untracked_files()
+        self.commit_files(
+            files=[self.__pyhist_file],
+            message=f"versioning: Init pyhist with version {version}",
+        )
+
+    def _get_commits(
+        self, since_commit_id: Optional[str] = None, with_paths: bool = False
+    ) -> List[CommitRecord]:
+        try:
+            branch = self.__repo.active_branch.name
+            if since_commit_id is not None and self._is_ancestor(
+                since_commit_id, branch
+            ):
+                commits = list(
+                    self._iter_commits(f"{since_commit_id}..{branch}", with_paths)
+                )
+                self.__since_commit_id = since_commit_id
+                return commits
+
+            return list(self._iter_commits(branch, with_paths))
+        except GitCommandError:
+            return []
+
+    def _iter_commits(
+        self, revision: str, with_paths: bool = False
+    ) -> Iterator[CommitRecord]:
+        with_paths = self._uses_paths(with_paths)
+        return self._filter_commits(self._iter_log(revision, with_paths))
+
+    def _uses_paths(self, with_paths: bool) -> bool:
+        # Paths come from the same log stream, so no commit is diffed on its own
+        return with_paths or self.__path_filter is not None
+
+    def _filter_commits(
+        self, commits: Iterable[CommitRecord]
+    ) -> Iterable[CommitRecord]:
+        if self.__path_filter is None:
+            return commits
+
+        return (
+            commit
+            for commit in commits
+            if self.__path_filter.is_relevant(self.get_commit_paths(commit.hexsha))
+        )
+
+    def _iter_log(
+        self, revision: str, with_paths: bool = False
+    ) -> Iterator[CommitRecord]:
+        process = self.__repo.git.log(
+            revision, *self._get_log_options(with_paths), as_process=True
+        )
+
+        yield from self._parse_log(
+            iter(lambda: process.stdout.read(self.LOG_CHUNK_SIZE), b""), with_paths
+        )
+
+        process.wait()
+
+    def _get_log_options(self, with_paths: bool = False) -> List[str]:
+        options = ["-z", "--date=raw"]
+        if not with_paths:
+            return options + [f"--format={self.__log_format}"]
 
-        if self.__pyhist_file in untracked_files:
-            self.__repo.index.add(self.__pyhist_file)
-            self.__repo.git.commit(
-                "-m", f"versioning: Init pyhist with version {version}"
+        # Each commit starts with a record separator and is followed by its paths,
+        # the first one prefixed by a newline. Renames are listed as both paths
+        return options + [
+            "--name-only",
+            "--no-renames",
+            f"--format=%x1e{self.__log_format}",
+        ]
+
+    def _parse_log(
+        self, chunks: Iterable[bytes], with_paths: bool = False
+    ) -> Iterator[CommitRecord]:
+        self.__head_commit_id = None
+        entries = self._split_log_entries(chunks)
+        if not with_paths:
+            for entry in entries:
+                commit = self._parse_log_entry(entry)
+                if self.__head_commit_id is None:
+                    self.__head_commit_id = commit.hexsha
+                yield commit
+            return
+
+        commit, paths = None, []
+        for entry in entries:
+            if entry.startswith(b"\x1e"):
+                if commit is not None:
+                    self.__commit_paths[commit.hexsha] = tuple(paths)
+                    yield commit
+                commit, paths = self._parse_log_entry(entry[1:]), []
+                if self.__head_commit_id is None:
+                    self.__head_commit_id = commit.hexsha
+            elif entry.strip(b"\n"):
+                paths.append(entry.lstrip(b"\n").decode("utf-8", errors="replace"))
+
+        if commit is not None:
+            self.__commit_paths[commit.hexsha] = tuple(paths)
+            yield commit
+
+    @classmethod
+    def _split_log_entries(cls, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        pending = b""
+        for chunk in chunks:
+            entries = (pending + chunk).split(b"\0")
+            pending = entries.pop()
+            yield from entries
+
+        if pending:
+            yield pending
+
+    def _parse_log_entry(self, entry: bytes) -> CommitRecord:
+        hexsha, date, message = entry.decode("utf-8", errors="replace").split("\x1f", 2)
+        timestamp, tz = date.split()
+        tz_seconds = int(tz[1:3]) * 3600 + int(tz[3:5]) * 60
+
+        binsha = bytes.fromhex(hexsha)
+        committed_date = int(timestamp)
+        # Cached commits are not classified again
+        cache_entry = self.commit_cache.get(binsha, committed_date)
+
+        commit = CommitRecord(
+            hexsha=hexsha,
+            message=message,
+            committed_date=committed_date,
+            # Seconds west of UTC, as GitPython stores it
+            committer_tz_offset=tz_seconds if tz[0] == "-" else -tz_seconds,
+            type_code=cache_entry.type_code if cache_entry is not None else None,
+        )
+
+        if cache_entry is None:
+            self.commit_cache.put(
+                binsha,
+                CacheEntry(
+                    type_code=commit.type_code,
+                    version=None,
+                    committed_date=committed_date,
+                ),
             )
 
-    def _get_commits(self) -> List[Commit]:
+        return commit
+
+    def _commit_with_plumbing(self, files: List[str], message: str) -> None:
+        # Only the entries of the files are written to the index, and the branch
+        # is only moved if it still points to the parent of the new commit
+        git = self.__repo.git
         try:
-            return [
-                commit
-                for commit in self.__repo.iter_commits(self.__repo.active_branch.name)
-            ]
+            ref = git.symbolic_ref("HEAD")
         except GitCommandError:
-            return []
+            ref = "HEAD"
+        try:
+            parent = git.rev_parse("--verify", "--quiet", ref)
+        except GitCommandError:
+            parent = None
+
+        existing_files = [file for file in files if os.path.exists(file)]
+        blobs = []
+        if existing_files:
+            blobs = git.hash_object("-w", "--", *existing_files).split()
+
+        git.update_index(*self._get_index_updates(files, existing_files, blobs))
+        tree = git.write_tree()
+        commit = git.commit_tree(tree, *self._get_commit_options(parent, message))
+        git.update_ref(*self._get_ref_update(ref, commit, parent, message))
+
+    @classmethod
+    def _get_index_updates(
+        cls, files: List[str], existing_files: List[str], blobs: List[str]
+    ) -> List[str]:
+        updates = ["--add"]
+        for file, blob in zip(existing_files, blobs):
+            mode = "100755" if os.access(file, os.X_OK) else "100644"
+            updates += ["--cacheinfo", f"{mode},{blob},{file}"]
+
+        removed_files = [file for file in files if file not in existing_files]
+        if removed_files:
+            updates += ["--force-remove", "--"] + removed_files
+
+        return updates
+
+    @classmethod
+    def _get_commit_options(cls, parent: Optional[str], message: str) -> List[str]:
+        return (["-p", parent] if parent else []) + ["-m", message]
+
+    @classmethod
+    def _get_ref_update(
+        cls, ref: str, commit: str, parent: Optional[str], message: str
+    ) -> List[str]:
+        # An empty old value requires the ref not to exist, as in the first commit
+        subject = message.split("\n", 1)[0]
+        return ["-m", f"commit: {subject}", ref, commit, parent or ""]
+
+    def _is_ancestor(self, commit_id: str, branch: str) -> bool:
+        try:
+            return self.__repo.is_ancestor(commit_id, branch)
+        except (GitCommandError, BadName, ValueError):
+            return False
 
     @classmethod
     def _process_commit_message(cls, commit_message: str) -> str:
@@ -70,13 +362,29 @@ class GitHistory:
 
         return commit_message.split("\n")[0]
 
-    def _get_untracked_files(self) -> List[str]:
-        try:
-            diff: List[Diff] = self.__repo.index.diff("HEAD") + self.__repo.index.diff(
-                None
-            )
-            return [
-                file.a_path or file.b_path for file in diff
-            ] + self.__repo.untracked_files
-        except BadName:
-            return self.__repo.untracked_files
+    def _get_untracked_files(self, files: List[str]) -> List[str]:
+        # Only the given files are checked, so the time does not grow with the tree
+        if not files:
+            return []
+
+        status = self.__repo.git.status(
+            *self.STATUS_OPTIONS, "--", *files, stdout_as_string=False
+        )
+        return self._parse_status(status)
+
+    @classmethod
+    def _parse_status(cls, status: bytes) -> List[str]:
+        # Changed entries hold a fixed number of fields before the path, and
+        # renamed ones are followed by their original path
+        paths = []
+        entries = iter(status.split(b"\0"))
+        for entry in entries:
+            kind = entry[:1]
+            if kind in cls.STATUS_FIELDS:
+                paths.append(entry.split(b" ", cls.STATUS_FIELDS[kind])[-1])
+                if kind == b"2":
+                    next(entries, None)
+            elif kind in (b"?", b"!"):
+                paths.append(entry[2:])
+
+        return [path.decode("utf-8", errors="replace") for path in paths]
@@ -1,19 +1,55 @@
 import os
-import pickle
-from typing import List, Optional
-
-from git import Commit
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.history_file import HistoryFile
+from pyhist.history.history_records import HistoryRecords
+from pyhist.history.history_view import HistoryView
 from pyhist.history.pyhist_item import PyHistItem
 from pyhist.history.history_exception import HistoryException
+from pyhist.io.atomic_writer import AtomicWriter
 from pyhist.versioning.commit_type import CommitType
 from pyhist.versioning.version import Version
 
+VersionKey = Tuple[int, int, int]
+
 
 class History:
-    def __init__(self):
-        self.__default_location = ".pyhist"
-        self.pyhist_items: List[PyHistItem] = []
+    def __init__(self, writer: Optional[AtomicWriter] = None, route: str = ".pyhist"):
+        self.__default_location = route
+        self.__writer = writer or AtomicWriter()
+        # Items are appended in insertion order and exposed newest first. Removed
+        # items are left as None tombstones until the list is compacted
+        self.__items: List[Optional[PyHistItem]] = []
+        self.__tombstones = 0
+        self.__has_removed_items = False
+        self.__commit_index: Dict[str, int] = {}
+        self.__version_index: Dict[VersionKey, List[int]] = {}
+        # Sorted positions of the version items, the last one is the last version
+        self.__version_positions: List[int] = []
+        # Records of the loaded file, older than the items appended since the load.
+        # They are decoded only once the history has to be rewritten
+        self.__records: Optional[HistoryRecords] = None
+        # Branch head of the last recorded walk, where the next walk starts from
+        self.__head_commit_id: Optional[str] = None
+
+    @property
+    def pyhist_items(self) -> HistoryView:
+        if self.__records is not None:
+            return HistoryView(self.__items, self.__records)
+        if self.__tombstones:
+            self._compact()
+
+        return HistoryView(self.__items)
+
+    @pyhist_items.setter
+    def pyhist_items(self, items: List[PyHistItem]) -> None:
+        self._close_records()
+        self.__items = list(reversed(items))
+        self.__tombstones = 0
+        self.__has_removed_items = False
+        self._reindex()
 
     def is_initialized(self) -> bool:
         return os.path.exists(self.__default_location)
@@ -21,9 +57,15 @@ class History:
     def load_history(self) -> None:
         if self.is_initialized():
             try:
-                with open(self.__default_location, "rb") as file:
-                    self.pyhist_items = pickle.load(file)
-                    file.close()
+                history_file = HistoryFile(self.__default_location)
+                records = history_file.map()
+                if records is None:
+                    self.pyhist_items = history_file.read()
+                    self.__head_commit_id = None
+                else:
+                    self.pyhist_items = []
+                    self.__records = records
+                    self.__head_commit_id = records.head_commit_id
             except IOError as e:
                 raise HistoryException("Error loading pyhist history", e)
         else:
@@ -33,55 +75,182 @@ class History:
 
     def save_history(self) -> None:
         try:
-            with open(self.__default_location, "wb") as file:
-                pickle.dump(self.pyhist_items, file)
-                file.close()
+            history_file = HistoryFile(self.__default_location, self.__writer)
+            if self.__records is None:
+                history_file.write(
+                    self.pyhist_items, head_commit_id=self.__head_commit_id
+                )
+            else:
+                history_file.write(
+                    HistoryView(self.__items),
+                    head_commit_id=self.__head_commit_id,
+                    base=self.__records,
+                )
         except IOError as e:
             raise HistoryException("Error updating pyhist history", e)
 
-    def sync(self, added_commits: List[Commit], removed_commits: List[Commit]) -> None:
-        for commit in removed_commits:
-            if not self._is_versioning_commit(commit):
-                self.remove_commit(commit)
+    def sync(
+        self, added_commits: List[CommitRecord], removed_commits: List[CommitRecord]
+    ) -> None:
+        # Nothing to sync, so a loaded history does not have to be decoded
+        if not added_commits and not removed_commits:
+            return
+
+        self.remove_commits(
+            commit
+            for commit in removed_commits
+            if not self._is_versioning_commit(commit)
+        )
 
         for commit in added_commits:
             if not self._is_versioning_commit(commit):
                 self.add_commit(commit)
 
-        self.save_history()
-
     def add_version(self, version: Version) -> None:
         item = PyHistItem(version=version, commit=None, is_version=True)
-        self.pyhist_items.insert(0, item)
+        self._append(item)
 
     def remove_version(self, version: Version) -> None:
-        for item in self.pyhist_items:
-            if item.version == version:
-                self.pyhist_items.remove(item)
+        self._materialize()
+        positions = self.__version_index.pop(self._get_version_key(version), [])
+        for position in positions:
+            self._remove_at(position)
 
-    def add_commit(self, commit: Commit) -> None:
+        self._compact_if_sparse()
+
+    def add_commit(self, commit: CommitRecord) -> None:
         item = PyHistItem(version=None, commit=commit, is_version=False)
-        self.pyhist_items.insert(0, item)
+        self._append(item)
+
+    def remove_commit(self, commit: CommitRecord) -> None:
+        self.remove_commits([commit])
+
+    def remove_commits(self, commits: Iterable[CommitRecord]) -> None:
+        commits = [commit for commit in commits if self.has_commit(commit.hexsha)]
+        if not commits:
+            return
+
+        self._materialize()
+        for commit in commits:
+            position = self.__commit_index.pop(commit.hexsha, None)
+            if position is not None:
+                self._remove_at(position)
 
-    def remove_commit(self, commit: Commit) -> None:
-        for item in self.pyhist_items:
-            if item.commit == commit:
-                self.pyhist_items.remove(item)
+        self._compact_if_sparse()
+
+    def has_commit(self, commit_id: str) -> bool:
+        if commit_id in self.__commit_index:
+            return True
+
+        return (
+            self.__records is not None
+            and self.__records.find_commit(bytes.fromhex(commit_id)) is not None
+        )
+
+    def has_removed_items(self) -> bool:
+        return self.__has_removed_items
 
     def has_any_version(self) -> bool:
-        return any(item.is_version for item in self.pyhist_items)
+        if self.__version_positions:
+            return True
+
+        return (
+            self.__records is not None
+            and self.__records.find_first(HistoryRecords.IS_VERSION) is not None
+        )
 
     def get_version_items(self) -> List[PyHistItem]:
-        return list(filter(lambda item: item.is_version, self.pyhist_items))
+        version_items = [
+            self.__items[position] for position in reversed(self.__version_positions)
+        ]
+        if self.__records is not None:
+            version_items += [
+                self.__records[index]
+                for index in self.__records.find_all(HistoryRecords.IS_VERSION)
+            ]
+
+        return version_items
+
+    def get_head_commit_id(self) -> Optional[str]:
+        return self.__head_commit_id
+
+    def set_head_commit_id(self, commit_id: Optional[str]) -> None:
+        self.__head_commit_id = commit_id
 
     def get_last_version(self) -> Optional[Version]:
-        versions = self.get_version_items()
-        return versions[0].version if len(versions) > 0 else None
+        if self.__version_positions:
+            return self.__items[self.__version_positions[-1]].version
+
+        if self.__records is not None:
+            index = self.__records.find_first(HistoryRecords.IS_VERSION)
+            return self.__records[index].version if index is not None else None
+
+        return None
 
     def is_initialized(self) -> bool:
         return os.path.exists(self.__default_location)
 
+    def _materialize(self) -> None:
+        if self.__records is not None:
+            self.pyhist_items = list(self.pyhist_items)
+
+    def _close_records(self) -> None:
+        if self.__records is not None:
+            self.__records.close()
+            self.__records = None
+
+    def _append(self, item: PyHistItem) -> None:
+        self._index(item, position=len(self.__items))
+        self.__items.append(item)
+
+    def _remove_at(self, position: int) -> None:
+        item = self.__items[position]
+        if item is None:
+            return
+
+        self.__items[position] = None
+        self.__tombstones += 1
+        self.__has_removed_items = True
+        if item.commit is not None:
+            self.__commit_index.pop(item.commit.hexsha, None)
+        if item.version is not None:
+            positions = self.__version_index.get(self._get_version_key(item.version))
+            if positions is not None and position in positions:
+                positions.remove(position)
+        if item.is_version:
+            index = bisect_left(self.__version_positions, position)
+            del self.__version_positions[index]
+
+    def _compact_if_sparse(self) -> None:
+        if self.__tombstones * 2 > len(self.__items):
+            self._compact()
+
+    def _compact(self) -> None:
+        self.__items = [item for item in self.__items if item is not None]
+        self.__tombstones = 0
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self.__commit_index = {}
+        self.__version_index = {}
+        self.__version_positions = []
+        for position, item in enumerate(self.__items):
+            self._index(item, position)
+
+    def _index(self, item: PyHistItem, position: int) -> None:
+        if item.commit is not None:
+            self.__commit_index[item.commit.hexsha] = position
+        if item.version is not None:
+            self.__version_index.setdefault(
+                self._get_version_key(item.version), []
+            ).append(position)
+        if item.is_version:
+            self.__version_positions.append(position)
+
+    @classmethod
+    def _get_version_key(cls, version: Version) -> VersionKey:
+        return version.major, version.minor, version.patch
+
     @classmethod
-    def _is_versioning_commit(cls, commit: Commit) -> bool:
-        versioning_type = CommitType.Versioning.value
-        return commit.message[: len(versioning_type)] == versioning_type
+    def _is_versioning_commit(cls, commit: CommitRecord) -> bool:
+        return commit.commit_type is CommitType.Versioning
@@ -0,0 +1,202 @@
+import mmap
+import pickle
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.history_exception import HistoryException
+from pyhist.history.history_records import Buffer, HistoryRecords
+from pyhist.history.pyhist_item import PyHistItem
+from pyhist.io.atomic_writer import AtomicWriter
+
+
+# Binary layout of the .pyhist file:
+#   - header: magic, format version, number of records, number of commits,
+#     message table size and binsha of the branch head walked last
+#   - records: one fixed-width record per pyhist item, in history order
+#   - sha index: binsha and record position of every commit, sorted by binsha.
+#     Positions count from the oldest record
+#   - message table: utf-8 commit messages, addressed by byte offset
+# Files written before this format hold pickled items, and are rewritten in it
+# on save
+class HistoryFile:
+    MAGIC = b"PYHIST"
+    FORMAT_VERSION = 1
+
+    PREFIX = struct.Struct("<6sH")
+    HEADER = HistoryRecords.HEADER
+    RECORD = HistoryRecords.RECORD
+    SHA_INDEX = HistoryRecords.SHA_INDEX
+
+    HAS_COMMIT = HistoryRecords.HAS_COMMIT
+    HAS_VERSION = HistoryRecords.HAS_VERSION
+    IS_VERSION = HistoryRecords.IS_VERSION
+    IS_MAJOR = HistoryRecords.IS_MAJOR
+
+    def __init__(self, route: str, writer: Optional[AtomicWriter] = None):
+        self.route = route
+        self.__writer = writer or AtomicWriter()
+
+    def read(self) -> List[PyHistItem]:
+        with open(self.route, "rb") as file:
+            content = file.read()
+
+        if not content.startswith(self.MAGIC):
+            return self._read_legacy(content)
+
+        format_version = self._get_format_version(content)
+        if format_version != self.FORMAT_VERSION:
+            raise HistoryException(
+                f"Unsupported pyhist history format: {format_version}"
+            )
+
+        return list(HistoryRecords(content))
+
+    def map(self) -> Optional[HistoryRecords]:
+        # Pickled and unsupported files cannot be mapped, they have to be read
+        with open(self.route, "rb") as file:
+            try:
+                content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return None
+
+        if (
+            content[: len(self.MAGIC)] != self.MAGIC
+            or self._get_format_version(content) != self.FORMAT_VERSION
+        ):
+            content.close()
+            return None
+
+        try:
+            return HistoryRecords(content, close=content.close)
+        except HistoryException:
+            content.close()
+            raise
+
+    def write(
+        self,
+        items: Sequence[PyHistItem],
+        head_commit_id: Optional[str] = None,
+        base: Optional[HistoryRecords] = None,
+    ) -> None:
+        # Items are newer than the base records, which are copied without decoding
+        content = self._encode(items, head_commit_id=head_commit_id, base=base)
+
+        with self.__writer.open(self.route, "wb") as file:
+            file.write(content)
+
+    def _encode(
+        self,
+        items: Sequence[PyHistItem],
+        head_commit_id: Optional[str] = None,
+        base: Optional[HistoryRecords] = None,
+    ) -> bytes:
+        records = []
+        sha_index = []
+        messages = []
+        base_count = len(base) if base is not None else 0
+        # Messages of the new items follow the base message table
+        message_offset = base.table_size if base is not None else 0
+
+        for position, item in enumerate(items):
+            flags = self.IS_VERSION if item.is_version else 0
+            binsha, commit_type, timestamp, tz_offset = bytes(20), 0, 0.0, 0
+            major, minor, patch = 0, 0, 0
+            message = b""
+
+            if item.commit is not None:
+                flags |= self.HAS_COMMIT
+                binsha = item.commit.binsha
+                message = item.commit.message.encode("utf-8")
+                commit_type = item.commit.type_code
+                timestamp = item.commit.committed_date
+                tz_offset = item.commit.committer_tz_offset
+                sha_index.append((binsha, base_count + len(items) - 1 - position))
+
+            if item.version is not None:
+                flags |= self.HAS_VERSION
+                if item.version.is_major:
+                    flags |= self.IS_MAJOR
+                major, minor, patch = (
+                    item.version.major,
+                    item.version.minor,
+                    item.version.patch,
+                )
+                if item.commit is None:
+                    timestamp = item.version.get_timestamp() or 0.0
+
+            records.append(
+                self.RECORD.pack(
+                    binsha,
+                    flags,
+                    commit_type,
+                    timestamp,
+                    tz_offset,
+                    major,
+                    minor,
+                    patch,
+                    message_offset,
+                    len(message),
+                )
+            )
+            messages.append(message)
+            message_offset += len(message)
+
+        sha_index.sort()
+        commit_count = len(sha_index)
+        index_entries = [self.SHA_INDEX.pack(*entry) for entry in sha_index]
+        message_table = b"".join(messages)
+        if base is not None:
+            records.append(base.get_records_bytes())
+            commit_count += base.commit_count
+            index_entries = self._merge_index(base, sha_index)
+            message_table = base.get_table_bytes() + message_table
+
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.FORMAT_VERSION,
+            len(items) + base_count,
+            commit_count,
+            len(message_table),
+            bytes.fromhex(head_commit_id) if head_commit_id else bytes(20),
+        )
+
+        return b"".join([header] + records + index_entries + [message_table])
+
+    @classmethod
+    def _merge_index(
+        cls, base: HistoryRecords, sha_index: List[Tuple[bytes, int]]
+    ) -> List[Buffer]:
+        # New entries are inserted between the slices of the sorted base index
+        base_index = base.get_index_bytes()
+        entries = []
+        start = 0
+        for binsha, position in sha_index:
+            end = base.find_index_slot(binsha) * cls.SHA_INDEX.size
+            entries.append(base_index[start:end])
+            entries.append(cls.SHA_INDEX.pack(binsha, position))
+            start = end
+
+        entries.append(base_index[start:])
+        return entries
+
+    @classmethod
+    def _get_format_version(cls, content: bytes) -> Optional[int]:
+        try:
+            return cls.PREFIX.unpack_from(content)[1]
+        except struct.error:
+            return None
+
+    @classmethod
+    def _read_legacy(cls, content: bytes) -> List[PyHistItem]:
+        # Files written before the binary format hold pickled GitPython commits
+        try:
+            items: List[PyHistItem] = pickle.loads(content)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            raise HistoryException("Corrupted pyhist history", e)
+
+        for item in items:
+            if item.commit is not None:
+                item.commit = CommitRecord.from_commit(item.commit)
+
+        return items
@@ -0,0 +1,166 @@
+import struct
+from typing import Callable, Iterator, List, Optional, Sequence, Union
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.history_exception import HistoryException
+from pyhist.history.pyhist_item import PyHistItem
+from pyhist.versioning.version import Version
+
+Buffer = Union[bytes, memoryview]
+
+
+class HistoryRecords(Sequence):
+    # Random access over the fixed-width records of a .pyhist file. Items are only
+    # decoded when accessed, so a memory-mapped file is read page by page
+    # magic, format version, number of records, number of commits, message
+    # table size and binsha of the branch head walked last
+    HEADER = struct.Struct("<6sHIII20s")
+    # binsha, flags, commit type, timestamp, tz offset, major, minor, patch,
+    # message offset and message length, both in bytes
+    RECORD = struct.Struct("<20sBBdiiiiII")
+    # binsha and record position of every commit, sorted by binsha. Positions
+    # count from the oldest record, so newer records can be written first
+    SHA_INDEX = struct.Struct("<20sI")
+
+    FLAGS_OFFSET = 20
+    HAS_COMMIT = 1
+    HAS_VERSION = 2
+    IS_VERSION = 4
+    IS_MAJOR = 8
+
+    def __init__(self, buffer: Buffer, close: Optional[Callable[[], None]] = None):
+        self.__buffer = buffer
+        self.__close = close
+
+        try:
+            header = self.HEADER.unpack_from(buffer)
+        except struct.error as e:
+            raise HistoryException("Corrupted pyhist history", e)
+
+        _, _, count, commit_count, table_size, head_binsha = header
+        self.__count = count
+        self.__commit_count = commit_count
+        self.__head_binsha = head_binsha
+        self.__table_size = table_size
+        self.__records_start = self.HEADER.size
+        self.__index_start = self.__records_start + count * self.RECORD.size
+        self.__table_start = self.__index_start + commit_count * self.SHA_INDEX.size
+        if len(buffer) != self.__table_start + table_size:
+            raise HistoryException("Corrupted pyhist history")
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __getitem__(self, index: int) -> PyHistItem:
+        return self._decode_item(self._get_record(index))
+
+    @property
+    def head_commit_id(self) -> Optional[str]:
+        return self.__head_binsha.hex() if any(self.__head_binsha) else None
+
+    def close(self) -> None:
+        if self.__close is not None:
+            self.__close()
+            self.__close = None
+
+    @property
+    def commit_count(self) -> int:
+        return self.__commit_count
+
+    @property
+    def table_size(self) -> int:
+        return self.__table_size
+
+    def get_records_bytes(self) -> Buffer:
+        return self.__buffer[self.__records_start : self.__index_start]
+
+    def get_index_bytes(self) -> Buffer:
+        return self.__buffer[self.__index_start : self.__table_start]
+
+    def get_table_bytes(self) -> Buffer:
+        return self.__buffer[
+            self.__table_start : self.__table_start + self.__table_size
+        ]
+
+    def find_commit(self, binsha: bytes) -> Optional[int]:
+        slot = self.find_index_slot(binsha)
+        if slot == self.__commit_count:
+            return None
+
+        entry_binsha, position = self.SHA_INDEX.unpack_from(
+            self.__buffer, self.__index_start + slot * self.SHA_INDEX.size
+        )
+        return position if entry_binsha == binsha else None
+
+    def find_index_slot(self, binsha: bytes) -> int:
+        # Position of the first sha index entry not lower than binsha
+        low, high = 0, self.__commit_count
+        while low < high:
+            middle = (low + high) // 2
+            entry_start = self.__index_start + middle * self.SHA_INDEX.size
+            if self.__buffer[entry_start : entry_start + 20] < binsha:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def find_first(self, flag: int) -> Optional[int]:
+        # Records are stored newest first, so recent items are found early
+        return next(self._iter_flagged(flag), None)
+
+    def find_all(self, flag: int) -> List[int]:
+        return list(self._iter_flagged(flag))
+
+    def _iter_flagged(self, flag: int) -> Iterator[int]:
+        for index in range(self.__count):
+            record_start = self.__records_start + index * self.RECORD.size
+            if self.__buffer[record_start + self.FLAGS_OFFSET] & flag:
+                yield index
+
+    def _get_record(self, index: int) -> tuple:
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("history record index out of range")
+
+        return self.RECORD.unpack_from(
+            self.__buffer, self.__records_start + index * self.RECORD.size
+        )
+
+    def _decode_item(self, record: tuple) -> PyHistItem:
+        (
+            binsha,
+            flags,
+            commit_type,
+            timestamp,
+            tz_offset,
+            major,
+            minor,
+            patch,
+            message_offset,
+            message_length,
+        ) = record
+
+        commit = None
+        if flags & self.HAS_COMMIT:
+            message_start = self.__table_start + message_offset
+            message = self.__buffer[message_start : message_start + message_length]
+            commit = CommitRecord(
+                hexsha=binsha.hex(),
+                message=bytes(message).decode("utf-8"),
+                committed_date=int(timestamp),
+                committer_tz_offset=tz_offset,
+                type_code=commit_type,
+            )
+
+        version = None
+        if flags & self.HAS_VERSION:
+            version = Version().create_from_version_parts(major, minor, patch)
+            version.is_major = bool(flags & self.IS_MAJOR)
+            if commit is None:
+                version.set_timestamp(timestamp or None)
+
+        return PyHistItem(
+            commit=commit, version=version, is_version=bool(flags & self.IS_VERSION)
+        )
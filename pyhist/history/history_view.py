@@ -0,0 +1,47 @@
+from itertools import chain
+from typing import Iterator, List, Sequence, Union
+
+from pyhist.history.pyhist_item import PyHistItem
+
+
+class HistoryView(Sequence):
+    # Read-only newest-first view over the items History keeps in insertion order,
+    # followed by the older items still mapped from the history file
+    def __init__(self, items: List[PyHistItem], older_items: Sequence[PyHistItem] = ()):
+        self.__items = items
+        self.__older_items = older_items
+
+    def __len__(self) -> int:
+        return len(self.__items) + len(self.__older_items)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[PyHistItem, List[PyHistItem]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        if index >= len(self.__items):
+            return self.__older_items[index - len(self.__items)]
+
+        return self.__items[len(self.__items) - 1 - index]
+
+    def __iter__(self) -> Iterator[PyHistItem]:
+        return chain(reversed(self.__items), self.__older_items)
+
+    def __reversed__(self) -> Iterator[PyHistItem]:
+        return chain(reversed(self.__older_items), self.__items)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self)!r})"
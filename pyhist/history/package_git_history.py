@@ -0,0 +1,44 @@
+from typing import List, Optional
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.git_history import GitHistory
+
+
+class PackageGitHistory(GitHistory):
+    # Commits of one monorepo package, already walked by the main process. The
+    # versioning commit is also left to it, so every package is released at once
+    def __init__(
+        self,
+        commits: List[CommitRecord],
+        is_incremental: bool,
+        head_commit_id: Optional[str] = None,
+    ):
+        super().__init__()
+        self.git_commits = commits
+        self.__is_incremental = is_incremental
+        self.__head_commit_id = head_commit_id
+
+    def has_git_support(self) -> bool:
+        return True
+
+    def load_history(
+        self, since_commit_id: Optional[str] = None, with_paths: bool = False
+    ) -> None:
+        pass
+
+    def get_head_commit_id(self) -> Optional[str]:
+        return self.__head_commit_id
+
+    def is_incremental(self) -> bool:
+        return self.__is_incremental
+
+    def save_commit_cache(self) -> None:
+        pass
+
+    def add_versioning_commit(
+        self, version: str, files: Optional[List[str]] = None
+    ) -> None:
+        pass
+
+    def add_initial_commit(self, version: str) -> None:
+        pass
@@ -0,0 +1,35 @@
+import fnmatch
+import re
+from typing import Iterable, List, Optional, Pattern
+
+
+class PathFilter:
+    # Include and exclude fnmatch patterns over repository paths. A commit counts
+    # if it changes any included path which is not excluded
+    def __init__(
+        self, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None
+    ):
+        self.__include = self._compile(include or [])
+        self.__exclude = self._compile(exclude or [])
+
+    def matches(self, path: str) -> bool:
+        if self.__include is not None and not self.__include.match(path):
+            return False
+
+        return self.__exclude is None or not self.__exclude.match(path)
+
+    def is_relevant(self, paths: Iterable[str]) -> bool:
+        # Commits without changed paths, like merges or empty commits, are kept
+        paths = tuple(paths)
+        return not paths or any(self.matches(path) for path in paths)
+
+    @classmethod
+    def _compile(cls, patterns: List[str]) -> Optional[Pattern]:
+        if not patterns:
+            return None
+
+        # A folder pattern matches every path inside the folder
+        patterns = [
+            f"{pattern}*" if pattern.endswith("/") else pattern for pattern in patterns
+        ]
+        return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
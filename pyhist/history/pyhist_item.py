@@ -1,13 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from git import Commit
-
+from pyhist.history.commit_record import CommitRecord
 from pyhist.versioning.version import Version
 
 
 @dataclass
 class PyHistItem:
-    commit: Optional[Commit]
+    commit: Optional[CommitRecord]
     version: Optional[Version]
     is_version: bool
@@ -0,0 +1,74 @@
+import os
+import secrets
+import stat
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, Optional
+
+
+class AtomicWriter:
+    # Files are written to a temporary file in the target folder, fsync'd and then
+    # renamed over the target, so readers never see a partially written file
+    def __init__(self):
+        self.__pending: Optional[Dict[str, str]] = None
+
+    @contextmanager
+    def open(self, route: str, mode: str = "w", **kwargs) -> Iterator[IO]:
+        temporary_route = self._create_temporary_file(route)
+        try:
+            with open(temporary_route, mode, **kwargs) as file:
+                yield file
+                file.flush()
+                os.fsync(file.fileno())
+        except BaseException:
+            os.remove(temporary_route)
+            raise
+
+        if self.__pending is None:
+            self._replace(temporary_route, route)
+        else:
+            # A later write of the same file within the batch supersedes this one
+            previous_route = self.__pending.pop(route, None)
+            if previous_route is not None:
+                os.remove(previous_route)
+            self.__pending[route] = temporary_route
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        # Renames are deferred until every write of the batch has succeeded
+        if self.__pending is not None:
+            yield
+            return
+
+        self.__pending = {}
+        try:
+            yield
+        except BaseException:
+            for temporary_route in self.__pending.values():
+                os.remove(temporary_route)
+            raise
+        else:
+            for route, temporary_route in self.__pending.items():
+                self._replace(temporary_route, route)
+        finally:
+            self.__pending = None
+
+    @classmethod
+    def _create_temporary_file(cls, route: str) -> str:
+        temporary_route = f"{route}.{secrets.token_hex(4)}.tmp"
+        # Created with the default permissions, then the target ones are kept
+        os.close(os.open(temporary_route, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        if os.path.exists(route):
+            os.chmod(temporary_route, stat.S_IMODE(os.stat(route).st_mode))
+
+        return temporary_route
+
+    @classmethod
+    def _replace(cls, temporary_route: str, route: str) -> None:
+        os.replace(temporary_route, route)
+
+        if os.name == "posix":
+            folder = os.open(os.path.dirname(os.path.abspath(route)), os.O_RDONLY)
+            try:
+                os.fsync(folder)
+            finally:
+                os.close(folder)
@@ -0,0 +1,52 @@
+import difflib
+import io
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, Optional
+
+from pyhist.io.atomic_writer import AtomicWriter
+
+
+class CapturingWriter(AtomicWriter):
+    # Keeps written files in memory instead of writing them, for dry runs
+    def __init__(self):
+        super().__init__()
+        self.__files: Dict[str, bytes] = {}
+
+    @contextmanager
+    def open(self, route: str, mode: str = "w", **kwargs) -> Iterator[IO]:
+        file = io.BytesIO() if "b" in mode else io.StringIO()
+        yield file
+
+        content = file.getvalue()
+        self.__files[route] = content if "b" in mode else content.encode("utf-8")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        yield
+
+    @property
+    def files(self) -> Dict[str, bytes]:
+        return dict(self.__files)
+
+    def get_content(self, route: str) -> Optional[bytes]:
+        return self.__files.get(route)
+
+    def diff(self, route: str) -> str:
+        content = self.get_content(route)
+        if content is None:
+            return ""
+
+        try:
+            with open(route, "rb") as file:
+                previous_content = file.read()
+        except FileNotFoundError:
+            previous_content = b""
+
+        return "".join(
+            difflib.unified_diff(
+                previous_content.decode("utf-8").splitlines(keepends=True),
+                content.decode("utf-8").splitlines(keepends=True),
+                fromfile=f"a/{route}",
+                tofile=f"b/{route}",
+            )
+        )
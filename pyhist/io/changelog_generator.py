@@ -1,62 +1,132 @@
-from git import Commit
+import io
+import shutil
+from typing import Iterable, List, Optional, TextIO
 
+from pyhist.history.commit_record import CommitRecord
 from pyhist.history.history import History
 from pyhist.history.pyhist_item import PyHistItem
+from pyhist.io.atomic_writer import AtomicWriter
 
 
 class ChangelogGenerator:
-    def __init__(self, history: History):
+    # Rendered fragments are flushed to disk once the buffer reaches this size
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        history: History,
+        writer: Optional[AtomicWriter] = None,
+        route: str = "CHANGELOG.md",
+    ):
         self.__history = history
-        self.__changelog_route = "CHANGELOG.md"
+        self.__writer = writer or AtomicWriter()
+        self.__changelog_route = route
         self.__repo_url = "https://github.com/jgoodman8/pyhist"
-        self.__changelog_content = ""
 
-    def generate_changelog(self) -> None:
-        self._add_header()
-        # self._add_new_version_title(version=new_version, is_breaking_change=is_breaking_change)
-        for items in self.__history.pyhist_items:
-            self._update_changelog_from_item(items)
+    @property
+    def changelog_route(self) -> str:
+        return self.__changelog_route
+
+    def generate_changelog(self, incremental: bool = True) -> None:
+        if incremental and self._prepend_last_version():
+            return
 
-        self._write()
+        with self.__writer.open(self.__changelog_route, "w") as changelog:
+            self._render(changelog, self.__history.pyhist_items)
 
-    def _add_header(self):
-        self.__changelog_content += "# Changelog\n\n"
-        self.__changelog_content += (
+    def _get_header(self) -> str:
+        return (
+            "# Changelog\n\n"
             "All notable changes to this project will be documented in this file."
-        )
-        self.__changelog_content += (
             f"See [pyhist]({self.__repo_url}) for commit guidelines.\n"
         )
 
-    def _update_changelog_from_item(self, item: PyHistItem) -> None:
+    def _render(self, changelog: TextIO, items: Iterable[PyHistItem]) -> None:
+        buffer = io.StringIO()
+        buffer.write(self._get_header())
+
+        for item in items:
+            self._update_changelog_from_item(buffer, item)
+            if buffer.tell() >= self.CHUNK_SIZE:
+                changelog.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+
+        changelog.write(buffer.getvalue())
+
+    def _prepend_last_version(self) -> bool:
+        # Renders only the items of the last version and splices them after the
+        # header. The previous sections are not re-rendered, but as the file is
+        # replaced atomically they are still read and copied to the new one
+        new_items = self._get_last_version_items()
+        if new_items is None or self.__history.has_removed_items():
+            return False
+
+        header = self._get_header().encode("utf-8")
+        previous_version = self.__history.get_version_items()[1].version
+        expected_start = header + f"\n## {previous_version.get_version()}".encode()
+        try:
+            changelog = open(self.__changelog_route, "rb")
+        except FileNotFoundError:
+            return False
+
+        with changelog:
+            if changelog.read(len(expected_start)) != expected_start:
+                return False
+
+            with self.__writer.open(self.__changelog_route, "wb") as new_changelog:
+                writer = io.TextIOWrapper(new_changelog, encoding="utf-8", newline="")
+                self._render(writer, new_items)
+                writer.flush()
+                writer.detach()
+
+                changelog.seek(len(header))
+                shutil.copyfileobj(changelog, new_changelog)
+
+        return True
+
+    def _get_last_version_items(self) -> Optional[List[PyHistItem]]:
+        if len(self.__history.get_version_items()) < 2:
+            return None
+
+        items = []
+        for item in self.__history.pyhist_items:
+            if item.is_version and items:
+                return items
+            items.append(item)
+
+        return None
+
+    def _update_changelog_from_item(self, buffer: TextIO, item: PyHistItem) -> None:
         if item.is_version:
-            self._add_version_entry(item, is_breaking_change=item.version.is_major)
+            self._add_version_entry(
+                buffer, item, is_breaking_change=item.version.is_major
+            )
         else:
-            self._add_content_entry(item.commit)
+            self._add_content_entry(buffer, item.commit)
 
-    def _add_version_entry(self, item: PyHistItem, is_breaking_change: bool) -> None:
+    @classmethod
+    def _add_version_entry(
+        cls, buffer: TextIO, item: PyHistItem, is_breaking_change: bool
+    ) -> None:
         version: str = item.version.get_version()
         date: str = item.version.date()
 
         breaking_change_text = " ⚠ BREAKING CHANGES " if is_breaking_change else " "
-        self.__changelog_content += f"\n## {version}{breaking_change_text}({date})\n"
+        buffer.write(f"\n## {version}{breaking_change_text}({date})\n")
 
-    def _add_content_entry(self, commit: Commit) -> None:
-        date = self._get_commit_date(commit)
+    @classmethod
+    def _add_content_entry(cls, buffer: TextIO, commit: CommitRecord) -> None:
+        date = cls._get_commit_date(commit)
         message_parts = commit.message.split(":")
 
         if len(message_parts) >= 2:
             commit_type = message_parts[0]
             message = "".join(message_parts[1:])
-            self.__changelog_content += f"- **{commit_type}**: {message} ({date})\n"
+            buffer.write(f"- **{commit_type}**: {message} ({date})\n")
         else:
-            self.__changelog_content += f"- {commit.message} ({date})\n"
-
-    def _write(self) -> None:
-        file = open(self.__changelog_route, "w")
-        file.write(self.__changelog_content)
-        file.close()
+            buffer.write(f"- {commit.message} ({date})\n")
 
     @classmethod
-    def _get_commit_date(cls, commit: Commit) -> str:
+    def _get_commit_date(cls, commit: CommitRecord) -> str:
         return str(commit.committed_datetime.date())
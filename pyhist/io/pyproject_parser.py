@@ -0,0 +1,21 @@
+import re
+from typing import Optional
+
+from pyhist.io.atomic_writer import AtomicWriter
+from pyhist.io.section_version_parser import SectionVersionParser
+
+
+class PyprojectParser(SectionVersionParser):
+    # PEP 621 metadata goes first, then poetry
+    sections = [b"project", b"tool.poetry"]
+    version_pattern = re.compile(
+        rb"""^\s*version\s*=\s*(?P<quote>["'])(?P<value>[^"'\r\n]*)(?P=quote)"""
+    )
+    name_pattern = re.compile(
+        rb"""^\s*name\s*=\s*(?P<quote>["'])(?P<value>[^"'\r\n]+)(?P=quote)"""
+    )
+
+    def __init__(
+        self, route: str = "pyproject.toml", writer: Optional[AtomicWriter] = None
+    ):
+        super().__init__(route=route, writer=writer)
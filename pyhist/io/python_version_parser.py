@@ -0,0 +1,77 @@
+import ast
+import io
+import sys
+import tokenize
+from abc import abstractmethod
+from typing import List, Optional
+
+from pyhist.io.version_parser import Span, VersionParser
+from pyhist.versioning.version_exception import VersionException
+
+
+class PythonVersionParser(VersionParser):
+    # Finds the version string literal of a Python file with ast. Python 3.7
+    # nodes have no end offset, so the literal end comes from its token
+    def _locate_version_span(self, content: bytes) -> Span:
+        try:
+            tree = ast.parse(content)
+        except SyntaxError as e:
+            raise VersionException(f"Cannot parse {self._get_file_name()}", e)
+
+        version_node = self._find_version_node(tree)
+        if version_node is None:
+            raise VersionException(f"Cannot find version in {self._get_file_name()}")
+
+        line_starts = self._get_line_starts(content)
+        for token in tokenize.tokenize(io.BytesIO(content).readline):
+            if token.type != tokenize.STRING or token.start[0] != version_node.lineno:
+                continue
+
+            start_row, start_col = token.start
+            start = line_starts[start_row - 1] + len(
+                token.line[:start_col].encode("utf-8")
+            )
+            if start - line_starts[start_row - 1] != version_node.col_offset:
+                continue
+
+            # Only plain literals are rewritten, so the value is the literal
+            # without its prefix and quotes
+            value = ast.literal_eval(version_node)
+            prefix_length = len(token.string) - len(token.string.lstrip("rRuU"))
+            quote_length = (
+                3 if token.string[prefix_length:].startswith(('"""', "'''")) else 1
+            )
+            value_start = prefix_length + quote_length
+            if (
+                token.end[0] != start_row
+                or token.string[value_start : len(token.string) - quote_length] != value
+            ):
+                break
+
+            return (
+                start + len(token.string[:value_start].encode("utf-8")),
+                start + len(token.string[:-quote_length].encode("utf-8")),
+            )
+
+        raise VersionException(f"Cannot find version in {self._get_file_name()}")
+
+    @abstractmethod
+    def _find_version_node(self, tree: ast.AST) -> Optional[ast.expr]:
+        pass
+
+    @classmethod
+    def _is_string(cls, node: ast.expr) -> bool:
+        if sys.version_info < (3, 8):
+            return isinstance(node, ast.Str)
+
+        return isinstance(node, ast.Constant) and isinstance(node.value, str)
+
+    @classmethod
+    def _get_line_starts(cls, content: bytes) -> List[int]:
+        line_starts = [0]
+        position = content.find(b"\n")
+        while position >= 0:
+            line_starts.append(position + 1)
+            position = content.find(b"\n", position + 1)
+
+        return line_starts
@@ -0,0 +1,55 @@
+import re
+from typing import Dict, List, Optional, Pattern
+
+from pyhist.io.version_parser import Span, VersionParser
+from pyhist.versioning.version_exception import VersionException
+
+
+class SectionVersionParser(VersionParser):
+    # Finds a version key in the first matching section of an ini or toml like
+    # file, scanning it line by line without parsing the rest of the file
+    _SECTION = re.compile(rb"^\s*\[(?!\[)\s*([^\[\]]+?)\s*\]\s*(?:#.*)?$")
+    sections: List[bytes] = []
+    version_pattern: Pattern = None
+    name_pattern: Pattern = None
+
+    def get_package_names(self) -> List[str]:
+        try:
+            content = self._read_file()
+        except VersionException:
+            return []
+
+        span = self._locate_span(content, self.name_pattern)
+        return [] if span is None else [content[span[0] : span[1]].decode("utf-8")]
+
+    def _locate_version_span(self, content: bytes) -> Span:
+        span = self._locate_span(content, self.version_pattern)
+        if span is None:
+            raise VersionException(f"Cannot find version in {self._get_file_name()}")
+
+        return span
+
+    def _locate_span(self, content: bytes, pattern: Pattern) -> Optional[Span]:
+        spans: Dict[bytes, Span] = {}
+        section = None
+        position = 0
+
+        for line in content.splitlines(keepends=True):
+            section_match = self._SECTION.match(line)
+            if section_match is not None:
+                section = section_match.group(1)
+            elif section in self.sections and section not in spans:
+                match = pattern.match(line)
+                if match is not None:
+                    spans[section] = (
+                        position + match.start("value"),
+                        position + match.end("value"),
+                    )
+
+            position += len(line)
+
+        for section in self.sections:
+            if section in spans:
+                return spans[section]
+
+        return None
@@ -0,0 +1,15 @@
+import re
+from typing import Optional
+
+from pyhist.io.atomic_writer import AtomicWriter
+from pyhist.io.section_version_parser import SectionVersionParser
+
+
+class SetupCfgParser(SectionVersionParser):
+    sections = [b"metadata"]
+    # attr: and file: directives are not versions, so the value starts with a digit
+    version_pattern = re.compile(rb"^version\s*[=:]\s*(?P<value>[0-9][^\s#;]*)")
+    name_pattern = re.compile(rb"^name\s*[=:]\s*(?P<value>[^\s#;]+)")
+
+    def __init__(self, route: str = "setup.cfg", writer: Optional[AtomicWriter] = None):
+        super().__init__(route=route, writer=writer)
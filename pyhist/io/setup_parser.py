@@ -1,48 +1,69 @@
-import re
-from typing import Tuple, Optional, Match, AnyStr
+import ast
+from typing import List, Optional
 
+from pyhist.io.atomic_writer import AtomicWriter
+from pyhist.io.python_version_parser import PythonVersionParser
 from pyhist.versioning.version_exception import VersionException
 
 
-class SetupParser:
-    def __init__(self, route: str = "setup.py"):
-        self.file_route: str = route
-        self.regex: str = "(version=['|\"])(.*)(['|\"])"
+class SetupParser(PythonVersionParser):
 
-    def persist_version(self, version: str) -> None:
-        file_content = self._read_setup_py()
-        updated_content = re.sub(
-            self.regex, repl=r"\g<1>{}\g<3>".format(version), string=file_content
-        )
-        self._rewrite_version(content=updated_content)
+    def __init__(self, route: str = "setup.py", writer: Optional[AtomicWriter] = None):
+        super().__init__(route=route, writer=writer)
 
-    def get_current_version_parts(self) -> Tuple[int, int, int]:
-        version_str = self._get_version_str()
-        return [int(version_part) for version_part in version_str.split(".")]
-
-    def _read_setup_py(self) -> AnyStr:
+    def get_package_names(self) -> List[str]:
+        # The name and the literal top level packages of the setup() call
         try:
-            file = open(self.file_route, "r")
-            file_content: AnyStr = file.read()
-            file.close()
+            tree = ast.parse(self._read_file())
+        except (SyntaxError, VersionException):
+            return []
 
-            return file_content
-        except FileNotFoundError as e:
-            raise VersionException("Cannot find setup.py", e)
+        names = []
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or not self._is_setup_call(node):
+                continue
 
-    def _rewrite_version(self, content: str) -> None:
-        try:
-            file_writer = open(self.file_route, "w")
-            file_writer.write(content)
-            file_writer.close()
-        except FileNotFoundError as e:
-            raise VersionException("Cannot find setup.py", e)
+            for keyword in node.keywords:
+                if keyword.arg not in ("name", "packages"):
+                    continue
+                try:
+                    value = ast.literal_eval(keyword.value)
+                except ValueError:
+                    continue
+
+                values = [value] if isinstance(value, str) else value
+                if isinstance(values, (list, tuple)):
+                    names.extend(
+                        value.split(".")[0]
+                        for value in values
+                        if isinstance(value, str)
+                    )
+
+        return names
+
+    def _find_version_node(self, tree: ast.AST) -> Optional[ast.expr]:
+        # A version keyword of a setup() call goes first, then any version keyword
+        candidates = []
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call):
+                continue
+
+            for keyword in node.keywords:
+                if keyword.arg == "version" and self._is_string(keyword.value):
+                    candidates.append((not self._is_setup_call(node), keyword.value))
+
+        if not candidates:
+            return None
 
-    def _get_version_str(self) -> AnyStr:
-        file_content: str = self._read_setup_py()
+        return min(
+            candidates, key=lambda candidate: (candidate[0], candidate[1].lineno)
+        )[1]
 
-        version_match: Optional[Match[AnyStr]] = re.search(self.regex, file_content)
-        if not version_match:
-            raise Exception("")
+    @classmethod
+    def _is_setup_call(cls, node: ast.Call) -> bool:
+        function = node.func
+        name = function.attr if isinstance(function, ast.Attribute) else None
+        if isinstance(function, ast.Name):
+            name = function.id
 
-        return version_match.group(2)
+        return name == "setup"
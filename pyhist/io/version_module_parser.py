@@ -0,0 +1,25 @@
+import ast
+from typing import Optional
+
+from pyhist.io.python_version_parser import PythonVersionParser
+
+
+class VersionModuleParser(PythonVersionParser):
+    # Python modules holding a module level __version__ = "x.y.z"
+
+    def _find_version_node(self, tree: ast.AST) -> Optional[ast.expr]:
+        for node in tree.body:
+            if isinstance(node, ast.Assign):
+                targets, value = node.targets, node.value
+            elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                targets, value = [node.target], node.value
+            else:
+                continue
+
+            if self._is_string(value) and any(
+                isinstance(target, ast.Name) and target.id == "__version__"
+                for target in targets
+            ):
+                return value
+
+        return None
@@ -0,0 +1,99 @@
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from pyhist.io.atomic_writer import AtomicWriter
+from pyhist.versioning.version_exception import VersionException
+
+Span = Tuple[int, int]
+
+
+class VersionParser(ABC):
+    # Reads a file that holds the package version and rewrites only the version
+    # span. Subclasses locate the span of the version value, without quotes
+    def __init__(self, route: str, writer: Optional[AtomicWriter] = None):
+        self.file_route: str = route
+        self.__writer = writer or AtomicWriter()
+        # The file is read once, and read again only if its mtime or size change
+        self.__content: Optional[bytes] = None
+        self.__file_stat: Optional[Tuple[int, int]] = None
+        self.__version_span: Optional[Span] = None
+
+    @property
+    def routes(self) -> List[str]:
+        return [self.file_route]
+
+    def has_version(self) -> bool:
+        try:
+            self._get_version_span()
+            return True
+        except VersionException:
+            return False
+
+    def persist_version(self, version: str) -> None:
+        file_content = self._read_file()
+        start, end = self._get_version_span()
+
+        self._rewrite_version(
+            content=file_content[:start] + version.encode("utf-8") + file_content[end:]
+        )
+
+    def get_current_version_parts(self) -> Tuple[int, int, int]:
+        version_str = self._get_version_str()
+        return [int(version_part) for version_part in version_str.split(".")]
+
+    def get_package_names(self) -> List[str]:
+        # Names of the packages declared by the file, if it declares any
+        return []
+
+    def _read_file(self) -> bytes:
+        try:
+            file_stat = os.stat(self.file_route)
+            file_stat = (file_stat.st_mtime_ns, file_stat.st_size)
+            if self.__content is not None and file_stat == self.__file_stat:
+                return self.__content
+
+            with open(self.file_route, "rb") as file:
+                self.__content = file.read()
+            self.__file_stat = file_stat
+            self.__version_span = None
+
+            return self.__content
+        except FileNotFoundError as e:
+            raise VersionException(f"Cannot find {self._get_file_name()}", e)
+
+    def _rewrite_version(self, content: bytes) -> None:
+        try:
+            with self.__writer.open(self.file_route, "wb") as file_writer:
+                file_writer.write(content)
+        except FileNotFoundError as e:
+            raise VersionException(f"Cannot find {self._get_file_name()}", e)
+
+        # The write may be deferred, so the file is checked again on next read
+        self.__content = None
+
+    def _get_version_str(self) -> str:
+        file_content = self._read_file()
+        start, end = self._get_version_span()
+
+        return file_content[start:end].decode("utf-8")
+
+    def _get_version_span(self) -> Span:
+        if self.__version_span is None:
+            content = self._read_file()
+            # Most files can be discarded without parsing them
+            if b"version" not in content:
+                raise VersionException(
+                    f"Cannot find version in {self._get_file_name()}"
+                )
+
+            self.__version_span = self._locate_version_span(content)
+
+        return self.__version_span
+
+    @abstractmethod
+    def _locate_version_span(self, content: bytes) -> Span:
+        pass
+
+    def _get_file_name(self) -> str:
+        return os.path.basename(self.file_route)
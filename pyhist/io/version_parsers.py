@@ -0,0 +1,109 @@
+import glob
+import os
+import re
+from typing import List, Optional, Set, Tuple
+
+from pyhist.io.atomic_writer import AtomicWriter
+from pyhist.io.pyproject_parser import PyprojectParser
+from pyhist.io.setup_cfg_parser import SetupCfgParser
+from pyhist.io.setup_parser import SetupParser
+from pyhist.io.version_module_parser import VersionModuleParser
+from pyhist.io.version_parser import VersionParser
+
+
+class VersionParsers:
+    # Every file holding the package version, discovered on each run as it only
+    # takes a few stats. The first one is the source of the current version, all
+    # of them are updated
+    MODULE_PATTERNS = [
+        os.path.join(folder, "*", module)
+        for folder in ["", "src"]
+        for module in ["__init__.py", "__version__.py", "_version.py"]
+    ]
+
+    def __init__(self, writer: Optional[AtomicWriter] = None, root: str = ""):
+        # root is the package folder, the current one unless stated otherwise
+        self.__writer = writer or AtomicWriter()
+        self.__root = root
+        self.__parsers: Optional[List[VersionParser]] = None
+
+    @property
+    def parsers(self) -> List[VersionParser]:
+        if self.__parsers is None:
+            self.__parsers = self._discover()
+
+        return self.__parsers
+
+    @property
+    def routes(self) -> List[str]:
+        return [route for parser in self.parsers for route in parser.routes]
+
+    def has_version(self) -> bool:
+        return self.parsers[0].has_version()
+
+    def persist_version(self, version: str) -> None:
+        # All the files are replaced together
+        with self.__writer.batch():
+            for parser in self.parsers:
+                parser.persist_version(version=version)
+
+    def get_current_version_parts(self) -> Tuple[int, int, int]:
+        return self.parsers[0].get_current_version_parts()
+
+    def _discover(self) -> List[VersionParser]:
+        metadata_parsers = [
+            parser
+            for parser in [
+                SetupParser(route=self._get_route("setup.py"), writer=self.__writer),
+                PyprojectParser(
+                    route=self._get_route("pyproject.toml"), writer=self.__writer
+                ),
+                SetupCfgParser(
+                    route=self._get_route("setup.cfg"), writer=self.__writer
+                ),
+            ]
+            if os.path.exists(parser.file_route)
+        ]
+
+        # Only the modules of the packages declared by the project are its own,
+        # any other one may be vendored or belong to another project
+        package_names = {
+            self._normalize(name)
+            for parser in metadata_parsers
+            for name in parser.get_package_names()
+        }
+        module_routes = sorted(
+            route.replace(os.sep, "/")
+            for pattern in self.MODULE_PATTERNS
+            for route in glob.glob(os.path.join(self.__root, pattern))
+            if self._is_package_module(route, package_names)
+        )
+
+        found_parsers = [
+            parser for parser in metadata_parsers if parser.has_version()
+        ] + [
+            parser
+            for parser in (
+                VersionModuleParser(route, writer=self.__writer)
+                for route in module_routes
+            )
+            if parser.has_version()
+        ]
+
+        # setup.py stays the default, so a missing version is reported as before
+        return found_parsers or [
+            SetupParser(route=self._get_route("setup.py"), writer=self.__writer)
+        ]
+
+    @classmethod
+    def _is_package_module(cls, route: str, package_names: Set[str]) -> bool:
+        package = os.path.basename(os.path.dirname(route))
+        return cls._normalize(package) in package_names
+
+    @classmethod
+    def _normalize(cls, name: str) -> str:
+        # Distribution names may use dashes or dots where packages use underscores
+        return re.sub(r"[-_.]+", "_", name).lower()
+
+    def _get_route(self, file_name: str) -> str:
+        return f"{self.__root}/{file_name}" if self.__root else file_name
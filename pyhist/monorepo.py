@@ -0,0 +1,254 @@
+import contextlib
+import glob
+import io
+import os
+import posixpath
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Set
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.git_history import GitHistory
+from pyhist.history.history import History
+from pyhist.history.history_exception import HistoryException
+from pyhist.history.package_git_history import PackageGitHistory
+from pyhist.io.atomic_writer import AtomicWriter
+from pyhist.io.capturing_writer import CapturingWriter
+from pyhist.io.changelog_generator import ChangelogGenerator
+from pyhist.io.version_parsers import VersionParsers
+from pyhist.pyhist import PyHist
+from pyhist.versioning.commit_type import CommitType
+from pyhist.versioning.semantic_versioning import SemanticVersioning
+
+
+class PackageTask(NamedTuple):
+    package: str
+    action: str
+    commits: List[CommitRecord]
+    is_incremental: bool
+    head_commit_id: Optional[str]
+    dry_run: bool
+
+
+class PackageRelease(NamedTuple):
+    package: str
+    version: Optional[str]
+    files: Dict[str, bytes]
+    output: str
+
+
+def _get_history_route(package: str) -> str:
+    return posixpath.join(package, ".pyhist")
+
+
+def _release_package(task: PackageTask) -> PackageRelease:
+    # Runs in a worker process. Files are only captured, the main process writes
+    # the files of every package and commits them together
+    writer = CapturingWriter()
+    history = History(writer=writer, route=_get_history_route(task.package))
+    git_history = PackageGitHistory(
+        commits=task.commits,
+        is_incremental=task.is_incremental,
+        head_commit_id=task.head_commit_id,
+    )
+    pyhist = PyHist(
+        history=history,
+        git_history=git_history,
+        semantic_versioning=SemanticVersioning(
+            git_history=git_history, history=history
+        ),
+        changelog_generator=ChangelogGenerator(
+            history=history,
+            writer=writer,
+            route=posixpath.join(task.package, "CHANGELOG.md"),
+        ),
+        setup_parser=VersionParsers(writer=writer, root=task.package),
+        writer=writer,
+        dry_run=task.dry_run,
+    )
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        getattr(pyhist, task.action)()
+
+    files = writer.files
+    version = None
+    if _get_history_route(task.package) in files:
+        version = history.get_last_version().get_version()
+
+    return PackageRelease(
+        package=task.package, version=version, files=files, output=output.getvalue()
+    )
+
+
+class MonoRepo:
+    # Releases every package of the repository from a single walk of the branch.
+    # Commits belong to the packages whose files they change
+    VERSION_FILES = ["setup.py", "pyproject.toml", "setup.cfg"]
+    PACKAGE_DEPTH = 2
+
+    def __init__(
+        self,
+        git_history: GitHistory,
+        writer: Optional[AtomicWriter] = None,
+        packages: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        dry_run: bool = False,
+    ):
+        self.git_history: GitHistory = git_history
+
+        self.__writer: AtomicWriter = writer or AtomicWriter()
+        self.__packages: Optional[List[str]] = packages
+        self.__max_workers: Optional[int] = max_workers
+        self.__dry_run: bool = dry_run
+
+    @property
+    def packages(self) -> List[str]:
+        if self.__packages is None:
+            self.__packages = self._discover()
+
+        return self.__packages
+
+    def setup(self) -> None:
+        if not self.git_history.has_git_support():
+            print("This repository has not git support")
+            return
+
+        packages = [
+            package
+            for package in self.packages
+            if not History(route=_get_history_route(package)).is_initialized()
+        ]
+        if not packages:
+            print("Pyhist is already initialized")
+            return
+
+        self.git_history.load_history(with_paths=True)
+        self._release(packages=packages, action="setup")
+
+    def update(self) -> None:
+        self._load_and_release(action="update")
+
+    def major(self) -> None:
+        self._load_and_release(action="major")
+
+    def _load_and_release(self, action: str) -> None:
+        histories = {
+            package: History(route=_get_history_route(package))
+            for package in self.packages
+        }
+        packages = [
+            package
+            for package, history in histories.items()
+            if history.is_initialized()
+        ]
+        if not packages:
+            raise HistoryException(
+                'PyHist is not initialized. Please, type "pyhist --init --monorepo"'
+            )
+
+        # The walk starts from the newest branch head already recorded by every package
+        head_commit_ids = []
+        for package in packages:
+            histories[package].load_history()
+            head_commit_ids.append(histories[package].get_head_commit_id())
+
+        self.git_history.load_history(
+            since_commit_id=self.git_history.get_common_ancestor(head_commit_ids),
+            with_paths=True,
+        )
+        self._release(packages=packages, action=action)
+
+    def _release(self, packages: List[str], action: str) -> None:
+        package_commits = self._assign_commits(packages)
+        tasks = [
+            PackageTask(
+                package=package,
+                action=action,
+                commits=package_commits[package],
+                is_incremental=self.git_history.is_incremental(),
+                head_commit_id=self.git_history.get_head_commit_id(),
+                dry_run=self.__dry_run,
+            )
+            for package in packages
+        ]
+
+        with ProcessPoolExecutor(max_workers=self.__max_workers) as executor:
+            releases = list(executor.map(_release_package, tasks))
+
+        if self.__dry_run:
+            for release in releases:
+                print(f"[{release.package}]")
+                print(release.output, end="")
+            return
+
+        # Files are replaced together, once every package has been released
+        with self.__writer.batch():
+            for release in releases:
+                for route, content in release.files.items():
+                    with self.__writer.open(route, "wb") as file:
+                        file.write(content)
+
+        released = [release for release in releases if release.version is not None]
+        if released:
+            self.git_history.commit_files(
+                files=[
+                    route
+                    for release in released
+                    for route in release.files
+                    if not route.startswith(os.path.join(".git", ""))
+                ],
+                message=self._get_commit_message(action=action, releases=released),
+            )
+
+        self.git_history.save_commit_cache()
+
+    def _assign_commits(self, packages: List[str]) -> Dict[str, List[CommitRecord]]:
+        package_set = set(packages)
+        package_commits = {package: [] for package in packages}
+        for commit in self.git_history.git_commits:
+            # Versioning commits change every released package, so they are skipped
+            if commit.commit_type is CommitType.Versioning:
+                continue
+
+            for package in self._get_commit_packages(commit, package_set):
+                package_commits[package].append(commit)
+
+        return package_commits
+
+    def _get_commit_packages(
+        self, commit: CommitRecord, packages: Set[str]
+    ) -> Set[str]:
+        commit_packages = set()
+        for path in self.git_history.get_commit_paths(commit.hexsha):
+            # A path belongs to its innermost package
+            folder = posixpath.dirname(path)
+            while folder and folder not in packages:
+                folder = posixpath.dirname(folder)
+            if folder:
+                commit_packages.add(folder)
+
+        return commit_packages
+
+    def _discover(self) -> List[str]:
+        packages = set()
+        for depth in range(1, self.PACKAGE_DEPTH + 1):
+            for file_name in self.VERSION_FILES:
+                pattern = os.path.join(*(["*"] * depth), file_name)
+                for route in glob.glob(pattern):
+                    packages.add(os.path.dirname(route).replace(os.sep, "/"))
+
+        return sorted(packages)
+
+    @classmethod
+    def _get_commit_message(cls, action: str, releases: List[PackageRelease]) -> str:
+        if action == "setup":
+            versions = ", ".join(
+                f"{release.package} with version {release.version}"
+                for release in releases
+            )
+            return f"versioning: Init pyhist in {versions}"
+
+        versions = ", ".join(
+            f"{release.package} to {release.version}" for release in releases
+        )
+        return f"versioning: Set version of {versions}"
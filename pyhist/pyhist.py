@@ -1,12 +1,15 @@
+import asyncio
 import copy
-from typing import List
-
-from git import Commit
+from typing import List, Optional, Union
 
+from pyhist.history.commit_record import CommitRecord
 from pyhist.history.history import History
 from pyhist.history.git_history import GitHistory
+from pyhist.io.atomic_writer import AtomicWriter
 from pyhist.io.changelog_generator import ChangelogGenerator
-from pyhist.io.setup_parser import SetupParser
+from pyhist.io.version_parser import VersionParser
+from pyhist.io.version_parsers import VersionParsers
+from pyhist.versioning.commit_type import CommitType
 from pyhist.versioning.semantic_versioning import SemanticVersioning
 from pyhist.versioning.version import Version
 
@@ -18,7 +21,9 @@ class PyHist:
         git_history: GitHistory,
         semantic_versioning: SemanticVersioning,
         changelog_generator: ChangelogGenerator,
-        setup_parser: SetupParser,
+        setup_parser: Union[VersionParser, VersionParsers],
+        writer: Optional[AtomicWriter] = None,
+        dry_run: bool = False,
     ):
 
         self.history: History = history
@@ -26,7 +31,10 @@ class PyHist:
         self.changelog_generator: ChangelogGenerator = changelog_generator
 
         self.__semantic_versioning: SemanticVersioning = semantic_versioning
-        self.__setup_parser: SetupParser = setup_parser
+        self.__setup_parser: Union[VersionParser, VersionParsers] = setup_parser
+        self.__writer: AtomicWriter = writer or AtomicWriter()
+        # Files are only captured by the writer and printed, nothing is committed
+        self.__dry_run: bool = dry_run
 
         self.__added_commits = None
         self.__removed_commits = None
@@ -43,20 +51,40 @@ class PyHist:
         self.git_history.load_history()
         self._init_pyhist()
         self._generate_initial_version()
+        self._save_commit_cache()
 
     def update(self) -> None:
-        self.git_history.load_history()
-        self.history.load_history()
+        self._load_histories()
 
         self._get_version_updates()
 
         if self._any_updates():
             self._perform_version_changes()
+        elif self.__dry_run:
+            print("No version changes")
+
+        self._save_commit_cache()
+
+    def check(self) -> bool:
+        # Only the last recorded branch head is read from both histories
+        self.history.load_history()
+        commit_count = self.git_history.count_commits_since(
+            self.history.get_head_commit_id()
+        )
+
+        if commit_count is None:
+            print("The branch history has been rewritten, a release is needed")
+            return True
+        if commit_count:
+            print(f"{commit_count} new commits, a release is needed")
+            return True
+
+        print("No release is needed")
+        return False
 
     def major(self) -> None:
         # Load history
-        self.git_history.load_history()
-        self.history.load_history()
+        self._load_histories()
 
         # Set previous version
         self.__semantic_versioning.version = self._get_previous_version()
@@ -65,6 +93,24 @@ class PyHist:
         self.__semantic_versioning.generate_release()
 
         self._perform_version_changes()
+        self._save_commit_cache()
+
+    def _load_histories(self) -> None:
+        asyncio.run(self._load_histories_async())
+
+    async def _load_histories_async(self) -> None:
+        # The walk starts from the head recorded in .pyhist, so it waits for the
+        # load. Version files are parsed in a thread meanwhile
+        loop = asyncio.get_running_loop()
+        parse_version_files = loop.run_in_executor(
+            None, self.__setup_parser.has_version
+        )
+
+        await loop.run_in_executor(None, self.history.load_history)
+        await self.git_history.load_history_async(
+            since_commit_id=self.history.get_head_commit_id()
+        )
+        await parse_version_files
 
     def _get_version_updates(self) -> None:
         # Set previous version
@@ -75,6 +121,7 @@ class PyHist:
         self.__removed_commits = self._get_removed_commits()
 
         # Sync pyhist history
+        self._record_head_commit()
         self.history.sync(
             added_commits=self.__added_commits, removed_commits=self.__removed_commits
         )
@@ -91,45 +138,60 @@ class PyHist:
         # Version to be set
         updated_version = self.__semantic_versioning.version
 
-        # Update version in setup.py
-        self.__setup_parser.persist_version(version=updated_version.get_version())
+        # Files are replaced together, once all of them have been written
+        with self.__writer.batch():
+            # Update version in setup.py
+            self.__setup_parser.persist_version(version=updated_version.get_version())
 
-        # Add version to pyhist history and save
-        self.history.add_version(version=updated_version)
-        self.history.save_history()
-
-        # Generate changelog
-        self.changelog_generator.generate_changelog()
+            # Add version to pyhist history and save
+            self.history.add_version(version=updated_version)
+            self.history.save_history()
 
-        # Create versioning commit with changelog.md, setup.py and .pyhist changes
-        self.git_history.add_versioning_commit(version=updated_version.get_version())
+            # Generate changelog
+            self.changelog_generator.generate_changelog()
 
-    def _get_added_commits(self) -> List[Commit]:
-        current_pyhist_commit_ids = [
-            item.commit.hexsha
-            for item in self.history.pyhist_items
-            if item.commit is not None
-        ]
+        if self.__dry_run:
+            self._print_dry_run(version=updated_version.get_version())
+            return
 
-        filtered_commits = filter(
-            lambda commit: commit.hexsha not in current_pyhist_commit_ids,
-            self.git_history.git_commits,
+        # Create versioning commit with changelog.md, version files and .pyhist changes
+        self.git_history.add_versioning_commit(
+            version=updated_version.get_version(), files=self.__setup_parser.routes
         )
 
-        return list(filtered_commits)
+    def _print_dry_run(self, version: str) -> None:
+        print(f"Next version: {version}")
+        print(self.__writer.diff(self.changelog_generator.changelog_route), end="")
 
-    def _get_removed_commits(self) -> List[Commit]:
-        git_commit_ids = [commit.hexsha for commit in self.git_history.git_commits]
-        filtered_items = filter(
-            lambda item: item.commit is not None
-            and item.commit.hexsha not in git_commit_ids,
-            self.history.pyhist_items,
-        )
+    def _save_commit_cache(self) -> None:
+        if not self.__dry_run:
+            self.git_history.save_commit_cache()
+
+    def _get_added_commits(self) -> List[CommitRecord]:
+        return [
+            commit
+            for commit in self.git_history.git_commits
+            if not self.history.has_commit(commit.hexsha)
+        ]
 
-        return [item.commit for item in filtered_items]
+    def _get_removed_commits(self) -> List[CommitRecord]:
+        if self.git_history.is_incremental():
+            # Recorded head is still an ancestor, so nothing has been removed
+            return []
+
+        git_commit_ids = set(self.git_history.get_commit_ids())
+        return [
+            item.commit
+            for item in self.history.pyhist_items
+            if item.commit is not None and item.commit.hexsha not in git_commit_ids
+        ]
 
     def _any_updates(self) -> bool:
-        return len(self.__added_commits) or len(self.__removed_commits)
+        # Versioning commits are not recorded, so on their own there is no release
+        return len(self.__removed_commits) or any(
+            commit.commit_type is not CommitType.Versioning
+            for commit in self.__added_commits
+        )
 
     def _get_previous_version(self) -> None:
         previous_version = self.history.get_last_version()
@@ -142,12 +204,19 @@ class PyHist:
 
     def _init_pyhist(self) -> None:
         for commit in self.git_history.git_commits:
-            if not self.__semantic_versioning.is_versioning_commit(commit.message):
+            if commit.commit_type is not CommitType.Versioning:
                 self.history.add_commit(commit)
             else:
                 # TODO: Move parse method
                 version = self.__semantic_versioning.parse_version_from_commit(commit)
                 self.history.add_version(version=version)
+        self._record_head_commit()
+
+    def _record_head_commit(self) -> None:
+        # An empty incremental walk keeps the head already recorded
+        head_commit_id = self.git_history.get_head_commit_id()
+        if head_commit_id is not None:
+            self.history.set_head_commit_id(head_commit_id)
 
     def _generate_initial_version(self) -> None:
         initial_version = Version().create_from_version_parts(
@@ -155,4 +224,8 @@ class PyHist:
         )
         self.history.add_version(version=initial_version)
         self.history.save_history()
+        if self.__dry_run:
+            self._print_dry_run(version=initial_version.get_version())
+            return
+
         self.git_history.add_initial_commit(version=initial_version.get_version())
@@ -0,0 +1,192 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from pyhist.history.async_git_history import AsyncGitHistory
+from pyhist.history.git_history import GitHistory
+from pyhist.history.history_exception import HistoryException
+from pyhist.history.path_filter import PathFilter
+
+
+class TestAsyncGitHistory:
+    @pytest.fixture(scope="function", autouse=True)
+    def git(self, tmp_path, monkeypatch):
+        # Each test runs in its own folder, removed along with every file created
+        monkeypatch.chdir(tmp_path)
+        os.system("git init")
+        os.system('git config --global user.email "test@test.com"')
+        os.system('git config --global user.name "Test"')
+
+        yield
+
+    def test_load_history_NoCommitsAdded_LoadedCommitsAreEmpty(self, git):
+        # arrange
+        git_history = AsyncGitHistory()
+
+        # act
+        git_history.load_history()
+
+        # assert
+        assert len(git_history.git_commits) == 0
+
+    def test_load_history_UnreadableLog_HistoryExceptionIsRaised(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+
+        git_history = AsyncGitHistory()
+
+        # act
+        with patch.object(
+            AsyncGitHistory, "_parse_log_entry", side_effect=ValueError
+        ), pytest.raises(HistoryException):
+            git_history.load_history()
+
+        # assert
+        assert len(git_history.git_commits) == 0
+
+    def test_load_history_TwoCommitsAdded_SameCommitsAsGitHistory(self, git):
+        # arrange
+        os.system("touch test.txt notes.md")
+        os.system("git add test.txt notes.md")
+        os.system('git commit -m "feat: Add files" -m "Longer description"')
+        os.system('echo "----" > notes.md')
+        os.system("git add notes.md")
+        os.system('git commit -m "docs: Update notes"')
+
+        git_history = GitHistory(path_filter=PathFilter(exclude=["*.md"]))
+        async_git_history = AsyncGitHistory(path_filter=PathFilter(exclude=["*.md"]))
+
+        # act
+        git_history.load_history()
+        async_git_history.load_history()
+
+        # assert
+        assert len(async_git_history.git_commits) == 1
+        assert async_git_history.git_commits == git_history.git_commits
+        assert async_git_history.get_commit_paths(
+            async_git_history.git_commits[0].hexsha
+        ) == ("notes.md", "test.txt")
+
+    def test_load_history_LogReadInSmallChunks_SameCommitsAsGitHistory(self, git):
+        # arrange
+        for index in range(5):
+            os.system(f'echo "{index}" > test.txt')
+            os.system("git add test.txt")
+            os.system(f'git commit -m "fix: Change {index}" -m "Description {index}"')
+
+        git_history = GitHistory()
+        async_git_history = AsyncGitHistory()
+
+        # act
+        git_history.load_history()
+        with patch.object(AsyncGitHistory, "LOG_CHUNK_SIZE", 7), patch.object(
+            AsyncGitHistory, "LOG_QUEUE_SIZE", 1
+        ):
+            async_git_history.load_history()
+
+        # assert
+        assert len(async_git_history.git_commits) == 5
+        assert async_git_history.git_commits == git_history.git_commits
+        assert (
+            async_git_history.get_head_commit_id() == git_history.get_head_commit_id()
+        )
+
+    def test_load_history_SinceLastCommit_OnlyNewCommitsLoaded(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+        last_commit_id = os.popen("git rev-parse HEAD").read().strip()
+        os.system('echo "----" > test.txt')
+        os.system("git add test.txt")
+        os.system('git commit -m "Updated file"')
+
+        git_history = AsyncGitHistory()
+
+        # act
+        git_history.load_history(since_commit_id=last_commit_id)
+
+        # assert
+        assert git_history.is_incremental()
+        assert [commit.subject for commit in git_history.git_commits] == [
+            "Updated file"
+        ]
+
+    def test_load_history_SinceRewrittenCommit_AllCommitsLoaded(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+        os.system('echo "----" > test.txt')
+        os.system("git add test.txt")
+        os.system('git commit -m "Updated file"')
+        rewritten_commit_id = os.popen("git rev-parse HEAD").read().strip()
+        os.system('git commit --amend -m "Amended file"')
+
+        git_history = AsyncGitHistory()
+
+        # act
+        git_history.load_history(since_commit_id=rewritten_commit_id)
+
+        # assert
+        assert not git_history.is_incremental()
+        assert len(git_history.git_commits) == 2
+
+    def test_commit_files_ChangedAndMissingFiles_OnlyChangedCommitted(self, git):
+        # arrange
+        os.system("touch committed.txt")
+        os.system("git add committed.txt")
+        os.system('git commit -m "Initial commit"')
+        os.system('echo "----" > committed.txt')
+        os.system("touch untracked.txt other.txt")
+
+        git_history = AsyncGitHistory()
+
+        # act
+        git_history.commit_files(
+            files=["committed.txt", "untracked.txt", "missing.txt"],
+            message="versioning: Set version to 0.0.1",
+        )
+
+        # assert
+        assert os.popen("git log -1 --format=%s").read().strip() == (
+            "versioning: Set version to 0.0.1"
+        )
+        assert os.popen("git show --name-only --format= HEAD").read().split() == [
+            "committed.txt",
+            "untracked.txt",
+        ]
+        assert git_history._get_untracked_files(
+            ["committed.txt", "untracked.txt", "other.txt"]
+        ) == ["other.txt"]
+
+    def test_commit_files_FastCommit_OnlyChangedFilesCommitted(self, git):
+        # arrange
+        os.system("touch committed.txt")
+        os.system("git add committed.txt")
+        os.system('git commit -m "Initial commit"')
+        os.system('echo "----" > committed.txt')
+        os.system("touch untracked.txt other.txt")
+
+        git_history = AsyncGitHistory(fast_commit=True)
+
+        # act
+        git_history.commit_files(
+            files=["committed.txt", "untracked.txt", "missing.txt"],
+            message="versioning: Set version to 0.0.1",
+        )
+
+        # assert
+        assert os.popen("git log -1 --format=%s").read().strip() == (
+            "versioning: Set version to 0.0.1"
+        )
+        assert os.popen("git show --name-only --format= HEAD").read().split() == [
+            "committed.txt",
+            "untracked.txt",
+        ]
+        assert git_history._get_untracked_files(
+            ["committed.txt", "untracked.txt", "other.txt"]
+        ) == ["other.txt"]
@@ -0,0 +1,112 @@
+import os
+import stat
+
+import pytest
+
+from pyhist.io.atomic_writer import AtomicWriter
+
+
+class TestAtomicWriter:
+    @pytest.fixture(scope="function")
+    def routes(self) -> list:
+        routes = ["atomic_file1", "atomic_file2"]
+        for route in routes:
+            with open(route, "w") as file:
+                file.write("original")
+
+        yield routes
+
+        for route in routes:
+            os.remove(route)
+
+    @classmethod
+    def read(cls, route: str) -> str:
+        with open(route, "r") as file:
+            return file.read()
+
+    @classmethod
+    def get_temporary_files(cls) -> list:
+        return [route for route in os.listdir(".") if route.endswith(".tmp")]
+
+    def test_open_WriteFile_TargetIsReplaced(self, routes: list):
+        # arrange
+        writer = AtomicWriter()
+
+        # act
+        with writer.open(routes[0], "w") as file:
+            file.write("updated")
+
+        # assert
+        assert self.read(routes[0]) == "updated"
+        assert self.get_temporary_files() == []
+
+    def test_open_ErrorWhileWriting_TargetIsKept(self, routes: list):
+        # arrange
+        writer = AtomicWriter()
+
+        # act
+        with pytest.raises(ValueError):
+            with writer.open(routes[0], "w") as file:
+                file.write("updated")
+                raise ValueError()
+
+        # assert
+        assert self.read(routes[0]) == "original"
+        assert self.get_temporary_files() == []
+
+    def test_open_ExistingFile_PermissionsAreKept(self, routes: list):
+        # arrange
+        writer = AtomicWriter()
+        os.chmod(routes[0], 0o640)
+
+        # act
+        with writer.open(routes[0], "w") as file:
+            file.write("updated")
+
+        # assert
+        assert stat.S_IMODE(os.stat(routes[0]).st_mode) == 0o640
+
+    def test_batch_WriteFiles_TargetsReplacedAtTheEnd(self, routes: list):
+        # arrange
+        writer = AtomicWriter()
+
+        # act
+        with writer.batch():
+            for route in routes:
+                with writer.open(route, "w") as file:
+                    file.write("updated")
+            contents_in_batch = [self.read(route) for route in routes]
+
+        # assert
+        assert contents_in_batch == ["original", "original"]
+        assert [self.read(route) for route in routes] == ["updated", "updated"]
+        assert self.get_temporary_files() == []
+
+    def test_batch_ErrorAfterFirstWrite_NoTargetIsReplaced(self, routes: list):
+        # arrange
+        writer = AtomicWriter()
+
+        # act
+        with pytest.raises(ValueError):
+            with writer.batch():
+                with writer.open(routes[0], "w") as file:
+                    file.write("updated")
+                raise ValueError()
+
+        # assert
+        assert [self.read(route) for route in routes] == ["original", "original"]
+        assert self.get_temporary_files() == []
+
+    def test_batch_SameFileWrittenTwice_LastWriteIsKept(self, routes: list):
+        # arrange
+        writer = AtomicWriter()
+
+        # act
+        with writer.batch():
+            for content in ["first", "second"]:
+                with writer.open(routes[0], "w") as file:
+                    file.write(content)
+
+        # assert
+        assert self.read(routes[0]) == "second"
+        assert self.get_temporary_files() == []
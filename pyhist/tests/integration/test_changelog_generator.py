@@ -0,0 +1,127 @@
+import os
+from typing import List
+
+import pytest
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.history import History
+from pyhist.io.changelog_generator import ChangelogGenerator
+from pyhist.versioning.version import Version
+
+
+class TestChangelogGenerator:
+    @pytest.fixture(scope="function")
+    def history(self) -> History:
+        history = History()
+        history.add_version(Version().create_from_version_parts(0, 0, 0))
+        for commit in self.create_commits(["feat: Add cli", "fix: Fix cli"], seed=0):
+            history.add_commit(commit)
+        history.add_version(Version().create_from_version_parts(0, 1, 1))
+
+        yield history
+
+        if os.path.exists("CHANGELOG.md"):
+            os.remove("CHANGELOG.md")
+
+    @classmethod
+    def create_commits(cls, messages: List[str], seed: int) -> List[CommitRecord]:
+        return [
+            CommitRecord(
+                hexsha=f"{seed:08x}{index:032x}",
+                message=message,
+                committed_date=1600000000 + index,
+                committer_tz_offset=0,
+            )
+            for index, message in enumerate(messages)
+        ]
+
+    @classmethod
+    def read_changelog(cls) -> str:
+        with open("CHANGELOG.md", "r") as changelog:
+            return changelog.read()
+
+    def test_generate_changelog_NewVersion_SameAsFullGeneration(self, history: History):
+        # arrange
+        generator = ChangelogGenerator(history)
+        generator.generate_changelog()
+        for commit in self.create_commits(["docs: Add readme", "feat: Add x"], seed=1):
+            history.add_commit(commit)
+        history.add_version(Version().create_from_version_parts(0, 2, 0))
+
+        # act
+        generator.generate_changelog()
+        incremental_changelog = self.read_changelog()
+        generator.generate_changelog(incremental=False)
+
+        # assert
+        assert incremental_changelog == self.read_changelog()
+        assert incremental_changelog.count("## 0.2.0") == 1
+        assert incremental_changelog.count("## 0.1.1") == 1
+
+    def test_generate_changelog_NewVersion_PreviousSectionsAreNotRendered(
+        self, history: History
+    ):
+        # arrange
+        generator = ChangelogGenerator(history)
+        generator.generate_changelog()
+        with open("CHANGELOG.md", "a") as changelog:
+            changelog.write("manually kept line\n")
+        history.add_version(Version().create_from_version_parts(1, 0, 0))
+
+        # act
+        generator.generate_changelog()
+
+        # assert
+        changelog = self.read_changelog()
+        assert changelog.index("## 1.0.0") < changelog.index("## 0.1.1")
+        assert changelog.endswith("manually kept line\n")
+
+    def test_generate_changelog_UnexpectedPreviousVersion_FullGeneration(
+        self, history: History
+    ):
+        # arrange
+        generator = ChangelogGenerator(history)
+        with open("CHANGELOG.md", "w") as changelog:
+            changelog.write("# Changelog\n\nmanually kept line\n")
+        history.add_version(Version().create_from_version_parts(1, 0, 0))
+
+        # act
+        generator.generate_changelog()
+
+        # assert
+        changelog = self.read_changelog()
+        assert "manually kept line" not in changelog
+        assert "## 0.1.1" in changelog
+
+    def test_generate_changelog_CommitRemoved_FullGeneration(self, history: History):
+        # arrange
+        generator = ChangelogGenerator(history)
+        generator.generate_changelog()
+        with open("CHANGELOG.md", "a") as changelog:
+            changelog.write("manually kept line\n")
+        history.remove_commit(history.pyhist_items[1].commit)
+        history.add_version(Version().create_from_version_parts(0, 1, 0))
+
+        # act
+        generator.generate_changelog()
+
+        # assert
+        changelog = self.read_changelog()
+        assert "manually kept line" not in changelog
+        assert "Fix cli" not in changelog
+
+    def test_generate_changelog_SmallChunks_SameAsSingleChunk(
+        self, history: History, monkeypatch
+    ):
+        # arrange
+        generator = ChangelogGenerator(history)
+        generator.generate_changelog(incremental=False)
+        single_chunk_changelog = self.read_changelog()
+        monkeypatch.setattr(ChangelogGenerator, "CHUNK_SIZE", 1)
+
+        # act
+        generator.generate_changelog(incremental=False)
+        generator.generate_changelog(incremental=False)
+
+        # assert
+        assert self.read_changelog() == single_chunk_changelog
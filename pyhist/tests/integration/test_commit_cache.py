@@ -0,0 +1,147 @@
+import os
+
+import pytest
+
+from pyhist.history.commit_cache import CacheEntry, CommitCache
+from pyhist.versioning.commit_type import CommitType
+
+
+class TestCommitCache:
+    @pytest.fixture(scope="function")
+    def route(self) -> str:
+        route = "pyhist-cache"
+
+        yield route
+
+        if os.path.exists(route):
+            os.remove(route)
+
+    @classmethod
+    def create_entry(cls, version=None) -> CacheEntry:
+        return CacheEntry(
+            type_code=CommitType.Feature.code,
+            version=version,
+            committed_date=1600000000,
+        )
+
+    def test_get_SavedEntries_EntriesAreLoaded(self, route: str):
+        # arrange
+        cache = CommitCache(route)
+        cache.put(b"\x02" * 20, self.create_entry(version=(1, 2, 3)))
+        cache.put(b"\x01" * 20, self.create_entry())
+        cache.save()
+
+        # act
+        loaded_cache = CommitCache(route)
+
+        # assert
+        assert loaded_cache.get(b"\x01" * 20, 1600000000) == self.create_entry()
+        assert loaded_cache.get(b"\x02" * 20, 1600000000).version == (1, 2, 3)
+        assert loaded_cache.get(b"\x03" * 20, 1600000000) is None
+
+    def test_get_DifferentCommittedDate_ReturnsNone(self, route: str):
+        # arrange
+        cache = CommitCache(route)
+        cache.put(b"\x01" * 20, self.create_entry())
+
+        # act
+        entry = cache.get(b"\x01" * 20, 1700000000)
+
+        # assert
+        assert entry is None
+
+    def test_save_FewNewEntries_EntriesAreAppended(self, route: str):
+        # arrange
+        cache = CommitCache(route)
+        cache.put(b"\x01" * 20, self.create_entry())
+        cache.save()
+        size = os.path.getsize(route)
+
+        appending_cache = CommitCache(route)
+        appending_cache.put(b"\x02" * 20, self.create_entry(version=(1, 2, 3)))
+
+        # act
+        appending_cache.save()
+
+        # assert
+        loaded_cache = CommitCache(route)
+        assert os.path.getsize(route) == size + CommitCache.RECORD.size
+        assert loaded_cache.get(b"\x01" * 20, 1600000000) == self.create_entry()
+        assert loaded_cache.get(b"\x02" * 20, 1600000000).version == (1, 2, 3)
+
+    def test_save_HalfWrittenRecord_RecordIsOverwritten(self, route: str):
+        # arrange
+        cache = CommitCache(route)
+        cache.put(b"\x01" * 20, self.create_entry())
+        cache.save()
+        with open(route, "ab") as file:
+            file.write(b"\xff" * (CommitCache.RECORD.size // 2))
+
+        appending_cache = CommitCache(route)
+        appending_cache.put(b"\x02" * 20, self.create_entry())
+
+        # act
+        appending_cache.save()
+
+        # assert
+        loaded_cache = CommitCache(route)
+        assert loaded_cache.get(b"\x01" * 20, 1600000000) == self.create_entry()
+        assert loaded_cache.get(b"\x02" * 20, 1600000000) == self.create_entry()
+
+    def test_save_ManyAppendedEntries_FileIsRewrittenSorted(self, route: str):
+        # arrange
+        cache = CommitCache(route)
+        cache.put(b"\x01" * 20, self.create_entry())
+        cache.save()
+        for index in range(CommitCache.MIN_APPENDED_RECORDS + 1):
+            cache.put(index.to_bytes(20, "big"), self.create_entry())
+
+        # act
+        cache.save()
+
+        # assert
+        with open(route, "rb") as file:
+            _, _, sorted_count = CommitCache.HEADER.unpack(
+                file.read(CommitCache.HEADER.size)
+            )
+        loaded_cache = CommitCache(route)
+        assert sorted_count == CommitCache.MIN_APPENDED_RECORDS + 2
+        assert loaded_cache.get(b"\x01" * 20, 1600000000) == self.create_entry()
+        assert loaded_cache.get((5).to_bytes(20, "big"), 1600000000) is not None
+
+    def test_save_MaxEntriesReached_OldestCommitsAreEvicted(self, route: str):
+        # arrange
+        cache = CommitCache(route, max_entries=2)
+        for index, committed_date in enumerate([1600000002, 1600000000, 1600000001]):
+            cache.put(
+                bytes([index]) * 20,
+                CacheEntry(
+                    type_code=CommitType.Fix.code,
+                    version=None,
+                    committed_date=committed_date,
+                ),
+            )
+
+        # act
+        cache.save()
+
+        # assert
+        loaded_cache = CommitCache(route)
+        assert loaded_cache.get(b"\x00" * 20, 1600000002) is not None
+        assert loaded_cache.get(b"\x01" * 20, 1600000000) is None
+        assert loaded_cache.get(b"\x02" * 20, 1600000001) is not None
+
+    def test_get_OtherSchemaVersion_CacheIsInvalidated(self, route: str):
+        # arrange
+        cache = CommitCache(route)
+        cache.put(b"\x01" * 20, self.create_entry())
+        cache.save()
+        with open(route, "r+b") as file:
+            file.seek(len(CommitCache.MAGIC))
+            file.write((CommitCache.SCHEMA_VERSION + 1).to_bytes(2, "little"))
+
+        # act
+        loaded_cache = CommitCache(route)
+
+        # assert
+        assert loaded_cache.get(b"\x01" * 20, 1600000000) is None
@@ -1,27 +1,26 @@
+import asyncio
 import os
 
 import pytest
+from git import GitCommandError, Repo
 
+from pyhist.history.commit_cache import CacheEntry
 from pyhist.history.git_history import GitHistory
+from pyhist.history.path_filter import PathFilter
+from pyhist.versioning.commit_type import CommitType
 
 
 class TestGitHistory:
     @pytest.fixture(scope="function", autouse=True)
-    def git(self):
-        git_folder = ".git"
+    def git(self, tmp_path, monkeypatch):
+        # Each test runs in its own folder, removed along with every file created
+        monkeypatch.chdir(tmp_path)
         os.system("git init")
         os.system('git config --global user.email "test@test.com"')
         os.system('git config --global user.name "Test"')
 
         yield
 
-        if os.path.exists(git_folder):
-            os.system(f"rm -r {git_folder}")
-
-        for file in os.listdir(os.curdir):
-            if ".py" not in file:
-                os.system(f"rm {file}")
-
     def test_load_history_NoCommitsAdded_LoadedCommitsAreEmpty(self, git):
         # arrange
         git_history = GitHistory()
@@ -62,3 +61,278 @@ class TestGitHistory:
 
         # assert
         assert len(git_history.git_commits) == 2
+
+    def test_load_history_SinceLastCommit_OnlyNewCommitsLoaded(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+        last_commit_id = os.popen("git rev-parse HEAD").read().strip()
+        os.system('echo "----" > test.txt')
+        os.system("git add test.txt")
+        os.system('git commit -m "Updated file"')
+
+        git_history = GitHistory()
+
+        # act
+        git_history.load_history(since_commit_id=last_commit_id)
+
+        # assert
+        assert git_history.is_incremental()
+        assert len(git_history.git_commits) == 1
+        assert git_history.git_commits[0].message.startswith("Updated file")
+
+    def test_load_history_async_SinceLastCommit_OnlyNewCommitsLoaded(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+        last_commit_id = os.popen("git rev-parse HEAD").read().strip()
+        os.system('echo "----" > test.txt')
+        os.system("git add test.txt")
+        os.system('git commit -m "Updated file"')
+
+        git_history = GitHistory()
+
+        # act
+        asyncio.run(git_history.load_history_async(since_commit_id=last_commit_id))
+
+        # assert
+        assert git_history.is_incremental()
+        assert len(git_history.git_commits) == 1
+        assert git_history.git_commits[0].message.startswith("Updated file")
+
+    def test_load_history_SinceRewrittenCommit_AllCommitsLoaded(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+        os.system('echo "----" > test.txt')
+        os.system("git add test.txt")
+        os.system('git commit -m "Updated file"')
+        rewritten_commit_id = os.popen("git rev-parse HEAD").read().strip()
+        os.system('git commit --amend -m "Amended file"')
+
+        git_history = GitHistory()
+
+        # act
+        git_history.load_history(since_commit_id=rewritten_commit_id)
+
+        # assert
+        assert not git_history.is_incremental()
+        assert len(git_history.git_commits) == 2
+
+    def test_load_history_CommitWithBody_RecordMatchesGitCommit(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system(
+            'GIT_COMMITTER_DATE="2020-01-01T23:30:00+0200" '
+            'git commit -m "feat: Add test file" -m "Longer description"'
+        )
+        git_commit = next(Repo(".git").iter_commits())
+
+        git_history = GitHistory()
+
+        # act
+        git_history.load_history()
+
+        # assert
+        record = git_history.git_commits[0]
+        assert record.hexsha == git_commit.hexsha
+        assert record.message == git_commit.message
+        assert record.subject == "feat: Add test file"
+        assert record.body == "Longer description"
+        assert record.committed_datetime == git_commit.committed_datetime
+        assert str(record.committed_datetime.date()) == "2020-01-01"
+
+    def test_load_history_CachedCommit_TypeIsReadFromCache(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "feat: Initial commit"')
+
+        git_history = GitHistory()
+        git_history.load_history()
+        commit = git_history.git_commits[0]
+        git_history.commit_cache.put(
+            commit.binsha,
+            CacheEntry(
+                type_code=CommitType.Fix.code,
+                version=None,
+                committed_date=commit.committed_date,
+            ),
+        )
+        git_history.save_commit_cache()
+
+        cached_git_history = GitHistory()
+
+        # act
+        cached_git_history.load_history()
+
+        # assert
+        assert os.path.exists(os.path.join(".git", "pyhist-cache"))
+        assert cached_git_history.git_commits[0].commit_type is CommitType.Fix
+
+    def test_load_history_WithPaths_ChangedPathsLoadedPerCommit(self, git):
+        # arrange
+        os.system("touch first.txt second.txt")
+        os.system("git add first.txt second.txt")
+        os.system('git commit -m "feat: Add files" -m "Longer description"')
+        os.system('git commit --allow-empty -m "chore: Empty commit"')
+        os.system('echo "----" > second.txt')
+        os.system("git add second.txt")
+        os.system('git commit -m "fix: Update second file"')
+
+        git_history = GitHistory()
+
+        # act
+        git_history.load_history(with_paths=True)
+
+        # assert
+        fix_commit, empty_commit, feat_commit = git_history.git_commits
+        assert fix_commit.message == "fix: Update second file\n"
+        assert feat_commit.body == "Longer description"
+        assert git_history.get_commit_paths(fix_commit.hexsha) == ("second.txt",)
+        assert git_history.get_commit_paths(empty_commit.hexsha) == ()
+        assert git_history.get_commit_paths(feat_commit.hexsha) == (
+            "first.txt",
+            "second.txt",
+        )
+
+    def test_get_common_ancestor_RewrittenCommit_NoAncestor(self, git):
+        # arrange
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+        first_commit_id = os.popen("git rev-parse HEAD").read().strip()
+        os.system('echo "----" > test.txt')
+        os.system("git add test.txt")
+        os.system('git commit -m "Updated file"')
+        second_commit_id = os.popen("git rev-parse HEAD").read().strip()
+
+        git_history = GitHistory()
+        common_ancestor = git_history.get_common_ancestor(
+            [first_commit_id, second_commit_id]
+        )
+        os.system('git commit --amend -m "Amended file"')
+
+        # act
+        rewritten_ancestor = git_history.get_common_ancestor(
+            [first_commit_id, second_commit_id]
+        )
+
+        # assert
+        assert common_ancestor == first_commit_id
+        assert rewritten_ancestor is None
+        assert git_history.get_common_ancestor([first_commit_id, None]) is None
+
+    def test_load_history_PathFilter_OnlyMatchingCommitsLoaded(self, git):
+        # arrange
+        os.system("touch code.py notes.md")
+        os.system("git add code.py notes.md")
+        os.system('git commit -m "feat: Add files"')
+        os.system('echo "----" > notes.md')
+        os.system("git add notes.md")
+        os.system('git commit -m "docs: Update notes"')
+        os.system('echo "----" > code.py')
+        os.system("git add code.py")
+        os.system('git commit -m "fix: Update code"')
+
+        git_history = GitHistory(path_filter=PathFilter(exclude=["*.md"]))
+
+        # act
+        git_history.load_history()
+
+        # assert
+        assert [commit.subject for commit in git_history.git_commits] == [
+            "fix: Update code",
+            "feat: Add files",
+        ]
+        assert git_history.count_commits_since(None) == 2
+
+    def test_get_untracked_files_ChangedFiles_OnlyChangedFilesOfTheListed(self, git):
+        # arrange
+        os.system("touch unchanged.txt modified.txt renamed.txt")
+        os.system("git add unchanged.txt modified.txt renamed.txt")
+        os.system('git commit -m "Initial commit"')
+        os.system('echo "----" > modified.txt')
+        os.system("git mv renamed.txt moved.txt")
+        os.system('touch staged.txt "with space.txt" ignored.txt')
+        os.system("git add staged.txt")
+
+        git_history = GitHistory()
+        git_history.load_history()
+
+        # act
+        untracked_files = git_history._get_untracked_files(
+            [
+                "unchanged.txt",
+                "modified.txt",
+                "moved.txt",
+                "staged.txt",
+                "with space.txt",
+                "missing.txt",
+            ]
+        )
+
+        # assert
+        assert sorted(untracked_files) == [
+            "modified.txt",
+            "moved.txt",
+            "staged.txt",
+            "with space.txt",
+        ]
+        assert git_history._get_untracked_files([]) == []
+
+    def test_commit_files_FastCommit_OnlyChangedFilesCommittedWithoutHooks(self, git):
+        # arrange
+        os.system("touch committed.txt unchanged.txt")
+        os.system('printf "#!/bin/sh\\nexit 1\\n" > .git/hooks/pre-commit')
+        os.system("chmod +x .git/hooks/pre-commit")
+
+        git_history = GitHistory(fast_commit=True)
+        git_history.load_history()
+
+        # act
+        git_history.commit_files(
+            files=["committed.txt", "missing.txt"], message="versioning: Initial"
+        )
+        os.system('echo "----" > committed.txt')
+        git_history.commit_files(
+            files=["committed.txt", "unchanged.txt"], message="versioning: Update"
+        )
+
+        # assert
+        repo = Repo(".git")
+        assert [commit.message for commit in repo.iter_commits()] == [
+            "versioning: Update\n",
+            "versioning: Initial\n",
+        ]
+        assert repo.head.commit.stats.files.keys() == {"committed.txt", "unchanged.txt"}
+        assert repo.git.show("HEAD:committed.txt") == "----"
+        assert (
+            git_history._get_untracked_files(["committed.txt", "unchanged.txt"]) == []
+        )
+
+    def test_commit_files_FastCommitAfterBranchMoved_BranchNotUpdated(self, git):
+        # arrange
+        class ConcurrentCommitGitHistory(GitHistory):
+            def _get_commit_options(self, parent, message):
+                os.system('git commit --allow-empty -m "Concurrent commit"')
+                return super()._get_commit_options(parent, message)
+
+        os.system("touch test.txt")
+        os.system("git add test.txt")
+        os.system('git commit -m "Initial commit"')
+        os.system('echo "----" > test.txt')
+
+        git_history = ConcurrentCommitGitHistory(fast_commit=True)
+        git_history.load_history()
+
+        # act
+        with pytest.raises(GitCommandError):
+            git_history.commit_files(files=["test.txt"], message="versioning: Update")
+
+        # assert
+        assert Repo(".git").head.commit.message == "Concurrent commit\n"
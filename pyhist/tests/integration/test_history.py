@@ -1,13 +1,18 @@
 import os
 import pickle
 from typing import List
+from unittest.mock import patch
 
 import pytest
 from git import Repo
 
+from pyhist.history.commit_record import CommitRecord
 from pyhist.history.history import History
+from pyhist.history.history_file import HistoryFile
+from pyhist.history.history_records import HistoryRecords
 from pyhist.history.pyhist_item import PyHistItem
 from pyhist.history.history_exception import HistoryException
+from pyhist.versioning.version import Version
 
 
 class TestHistory:
@@ -100,3 +105,158 @@ class TestHistory:
         new_history.load_history()
         assert len(new_history.pyhist_items) == 1
         assert new_history.pyhist_items == history.pyhist_items
+
+    def test_load_history_FromLegacyPickle_CommitsAreMigrated(
+        self, pyhist_items: List[PyHistItem]
+    ):
+        history = History()
+
+        history.load_history()
+
+        assert [item.commit.hexsha for item in history.pyhist_items] == [
+            item.commit.hexsha for item in pyhist_items
+        ]
+        assert all(
+            isinstance(item.commit, CommitRecord) for item in history.pyhist_items
+        )
+
+    def test_save_history_AddVersionAndSave_FileIsNotPickled(
+        self, pyhist_items: List[PyHistItem]
+    ):
+        # arrange
+        history = History()
+        history.load_history()
+        version = Version().create_from_str_version("0.1.0")
+        version.update()
+
+        # act
+        history.add_version(version)
+        history.save_history()
+
+        # assert
+        with open(".pyhist", "rb") as f:
+            assert f.read().startswith(b"PYHIST")
+
+        new_history = History()
+        new_history.load_history()
+        assert new_history.get_last_version().get_version() == "0.1.0"
+        assert [item.commit for item in new_history.pyhist_items[1:]] == [
+            item.commit for item in history.pyhist_items[1:]
+        ]
+
+    def test_has_commit_LoadAndRemoveCommit_IndexUpdated(
+        self, pyhist_items: List[PyHistItem]
+    ):
+        # arrange
+        history = History()
+        history.load_history()
+        removed_commit = history.pyhist_items[0].commit
+
+        # act
+        history.remove_commit(removed_commit)
+
+        # assert
+        assert not history.has_commit(removed_commit.hexsha)
+        assert history.has_commit(pyhist_items[1].commit.hexsha)
+
+    def test_load_history_SavedHistory_QueriesDoNotDecodeItems(
+        self, pyhist_items: List[PyHistItem]
+    ):
+        # arrange
+        history = History()
+        history.load_history()
+        version = Version().create_from_str_version("0.1.0")
+        version.update()
+        history.add_version(version)
+        history.save_history()
+
+        new_history = History()
+
+        # act
+        new_history.load_history()
+
+        # assert
+        with patch.object(
+            HistoryRecords, "__getitem__", wraps=HistoryRecords.__getitem__
+        ) as patch_getitem:
+            assert all(
+                new_history.has_commit(item.commit.hexsha) for item in pyhist_items
+            )
+            assert not new_history.has_commit("0" * 40)
+            assert new_history.has_any_version()
+            assert patch_getitem.call_count == 0
+        assert new_history.get_last_version().get_version() == "0.1.0"
+        assert [item.commit for item in new_history.pyhist_items] == [
+            item.commit for item in history.pyhist_items
+        ]
+
+    def test_save_history_AddCommitToSavedHistory_RecordsAreNotDecoded(
+        self, pyhist_items: List[PyHistItem]
+    ):
+        # arrange
+        history = History()
+        history.load_history()
+        history.save_history()
+
+        mapped_history = History()
+        mapped_history.load_history()
+        commit = CommitRecord(
+            hexsha="a" * 40,
+            message="feat: add feature\n",
+            committed_date=1600000000,
+            committer_tz_offset=0,
+        )
+        version = Version().create_from_str_version("0.1.0")
+        version.update()
+
+        # act
+        with patch.object(
+            HistoryRecords, "__getitem__", wraps=HistoryRecords.__getitem__
+        ) as patch_getitem:
+            mapped_history.sync(added_commits=[commit], removed_commits=[])
+            mapped_history.add_version(version)
+            mapped_history.save_history()
+
+            # assert
+            assert patch_getitem.call_count == 0
+
+        new_history = History()
+        new_history.load_history()
+        assert new_history.has_commit(commit.hexsha)
+        assert all(new_history.has_commit(item.commit.hexsha) for item in pyhist_items)
+        assert new_history.get_last_version().get_version() == "0.1.0"
+        assert [item.commit for item in new_history.pyhist_items] == [
+            None,
+            commit,
+        ] + [item.commit for item in pyhist_items]
+
+    def test_save_history_HeadCommitSet_HeadCommitIsLoaded(
+        self, pyhist_items: List[PyHistItem]
+    ):
+        # arrange
+        history = History()
+        history.load_history()
+        head_commit_id = pyhist_items[0].commit.hexsha
+        history.set_head_commit_id(head_commit_id)
+        history.save_history()
+
+        new_history = History()
+
+        # act
+        new_history.load_history()
+
+        # assert
+        assert history.get_head_commit_id() == head_commit_id
+        assert new_history.get_head_commit_id() == head_commit_id
+
+    def test_load_history_UnsupportedFormatVersion_HistoryExceptionIsRaised(self):
+        # arrange
+        with open(".pyhist", "wb") as f:
+            f.write(HistoryFile.PREFIX.pack(HistoryFile.MAGIC, 2))
+
+        # act
+        try:
+            with pytest.raises(HistoryException, match="Unsupported"):
+                History().load_history()
+        finally:
+            os.remove(".pyhist")
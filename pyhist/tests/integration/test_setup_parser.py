@@ -1,4 +1,5 @@
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -84,3 +85,60 @@ setup(
             version_parser.persist_version(
                 version=f"{expected_major}.{expected_minor}.{expected_patch}"
             )
+
+    def test_persist_version_LongLineWithOtherStrings_OnlyVersionLiteralReplaced(
+        self,
+    ):
+        # arrange
+        content = "setup(name='pkg', version=\"0.1.0\", description='version=\"9\"')\n"
+        with open("setup.py", "w") as f:
+            f.write(content)
+        version_parser = SetupParser(route="setup.py")
+
+        # act
+        version_parser.persist_version(version="1.2.3")
+
+        # assert
+        with open("setup.py", "r") as f:
+            assert f.read() == content.replace('"0.1.0"', '"1.2.3"')
+        os.remove("setup.py")
+
+    def test_get_current_version_parts_CalledTwice_FileIsReadOnce(self, setup_file):
+        # arrange
+        version_parser = SetupParser(route=setup_file)
+
+        # act
+        with patch("builtins.open", wraps=open) as patch_open:
+            version_parser.get_current_version_parts()
+            version_parser.get_current_version_parts()
+
+        # assert
+        assert patch_open.call_count == 1
+
+    def test_get_current_version_parts_FileChanged_ChangedVersionIsRead(
+        self, setup_file
+    ):
+        # arrange
+        version_parser = SetupParser(route=setup_file)
+        version_parser.get_current_version_parts()
+        with open(setup_file, "w") as f:
+            f.write("setup(version='10.0.1')\n")
+
+        # act
+        version_parts = version_parser.get_current_version_parts()
+
+        # assert
+        assert version_parts == [10, 0, 1]
+
+    def test_get_current_version_parts_VersionNotLiteral_RaisesVersionException(
+        self,
+    ):
+        # arrange
+        with open("setup.py", "w") as f:
+            f.write("setup(version=VERSION)\n")
+        version_parser = SetupParser(route="setup.py")
+
+        # act
+        with pytest.raises(VersionException, match="Cannot find version"):
+            version_parser.get_current_version_parts()
+        os.remove("setup.py")
@@ -0,0 +1,192 @@
+import os
+import shutil
+
+import pytest
+
+from pyhist.io.pyproject_parser import PyprojectParser
+from pyhist.io.setup_cfg_parser import SetupCfgParser
+from pyhist.io.setup_parser import SetupParser
+from pyhist.io.version_module_parser import VersionModuleParser
+from pyhist.io.version_parsers import VersionParsers
+from pyhist.versioning.version_exception import VersionException
+
+
+class TestVersionParsers:
+    pyproject_content = """[build-system]
+requires = ["poetry-core"]
+
+[tool.poetry]
+name = "package"
+version = "0.2.0"
+
+[project]
+name = "package"
+version = '0.3.0'  # PEP 621
+"""
+    setup_cfg_content = """[metadata]
+name = package
+version = 0.4.0
+
+[options]
+packages = find:
+"""
+    module_content = '"""Package."""\nimport os\n\n__version__ = "0.5.0"\n'
+
+    @pytest.fixture(scope="function")
+    def folder(self) -> str:
+        folder = "version_parsers_test"
+        os.makedirs(os.path.join(folder, ".git"))
+        os.makedirs(os.path.join(folder, "package"))
+        current_folder = os.getcwd()
+        os.chdir(folder)
+
+        yield folder
+
+        os.chdir(current_folder)
+        shutil.rmtree(folder)
+
+    @classmethod
+    def write(cls, route: str, content: str) -> None:
+        with open(route, "w") as file:
+            file.write(content)
+
+    @classmethod
+    def read(cls, route: str) -> str:
+        with open(route, "r") as file:
+            return file.read()
+
+    def test_get_current_version_parts_Pyproject_Pep621VersionGoesFirst(self, folder):
+        # arrange
+        self.write("pyproject.toml", self.pyproject_content)
+
+        # act
+        version_parts = PyprojectParser().get_current_version_parts()
+
+        # assert
+        assert version_parts == [0, 3, 0]
+
+    def test_get_current_version_parts_PoetryPyproject_PoetryVersionIsRead(
+        self, folder
+    ):
+        # arrange
+        pep_621_start = self.pyproject_content.index("[project]")
+        self.write("pyproject.toml", self.pyproject_content[:pep_621_start])
+
+        # act
+        version_parts = PyprojectParser().get_current_version_parts()
+
+        # assert
+        assert version_parts == [0, 2, 0]
+
+    def test_persist_version_SetupCfg_OnlyVersionIsChanged(self, folder):
+        # arrange
+        self.write("setup.cfg", self.setup_cfg_content)
+
+        # act
+        SetupCfgParser().persist_version(version="1.0.0")
+
+        # assert
+        assert self.read("setup.cfg") == self.setup_cfg_content.replace(
+            "0.4.0", "1.0.0"
+        )
+
+    def test_persist_version_VersionModule_OnlyVersionIsChanged(self, folder):
+        # arrange
+        route = os.path.join("package", "__init__.py")
+        self.write(route, self.module_content)
+
+        # act
+        VersionModuleParser(route).persist_version(version="1.0.0")
+
+        # assert
+        assert self.read(route) == self.module_content.replace("0.5.0", "1.0.0")
+
+    def test_get_current_version_parts_DynamicPep621Version_RaisesVersionException(
+        self, folder
+    ):
+        # arrange
+        self.write("pyproject.toml", '[project]\ndynamic = ["version"]\n')
+
+        # act
+        with pytest.raises(VersionException, match="Cannot find version"):
+            PyprojectParser().get_current_version_parts()
+
+    def test_persist_version_SeveralVersionFiles_AllFilesAreUpdated(self, folder):
+        # arrange
+        self.write("pyproject.toml", self.pyproject_content)
+        self.write("setup.cfg", self.setup_cfg_content)
+        self.write(os.path.join("package", "__init__.py"), self.module_content)
+        self.write(os.path.join("package", "cli.py"), "import os\n")
+        version_parsers = VersionParsers()
+
+        # act
+        version_parts = version_parsers.get_current_version_parts()
+        version_parsers.persist_version(version="1.0.0")
+
+        # assert
+        assert version_parts == [0, 3, 0]
+        assert version_parsers.routes == [
+            "pyproject.toml",
+            "setup.cfg",
+            "package/__init__.py",
+        ]
+        assert all(
+            parser.get_current_version_parts() == [1, 0, 0]
+            for parser in version_parsers.parsers
+        )
+
+    def test_parsers_UndeclaredPackageModule_ModuleIsNotUpdated(self, folder):
+        # arrange
+        self.write("pyproject.toml", self.pyproject_content)
+        self.write(os.path.join("package", "__init__.py"), self.module_content)
+        os.makedirs("vendored")
+        vendored_content = '__version__ = "7.4.2"\n'
+        self.write(os.path.join("vendored", "__init__.py"), vendored_content)
+        version_parsers = VersionParsers()
+
+        # act
+        version_parsers.persist_version(version="1.0.0")
+
+        # assert
+        assert version_parsers.routes == ["pyproject.toml", "package/__init__.py"]
+        assert self.read(os.path.join("vendored", "__init__.py")) == vendored_content
+
+    def test_get_package_names_SetupPyPackages_NameAndTopLevelPackagesReturned(
+        self, folder
+    ):
+        # arrange
+        self.write(
+            "setup.py",
+            "from setuptools import setup\n"
+            "setup(name='my-package', version='0.1.0', "
+            "packages=['my_package', 'my_package.cli', 'other'])\n",
+        )
+
+        # act
+        package_names = SetupParser().get_package_names()
+
+        # assert
+        assert package_names == ["my-package", "my_package", "my_package", "other"]
+
+    def test_parsers_ModuleAddedAfterFirstRun_ModuleIsFound(self, folder):
+        # arrange
+        self.write("setup.cfg", self.setup_cfg_content)
+        first_routes = VersionParsers().routes
+        self.write(os.path.join("package", "__init__.py"), self.module_content)
+
+        # act
+        routes = VersionParsers().routes
+
+        # assert
+        assert first_routes == ["setup.cfg"]
+        assert routes == ["setup.cfg", "package/__init__.py"]
+
+    def test_parsers_NoVersionFiles_DefaultsToSetupPy(self, folder):
+        # act
+        version_parsers = VersionParsers()
+
+        # assert
+        assert version_parsers.routes == ["setup.py"]
+        assert isinstance(version_parsers.parsers[0], SetupParser)
+        with pytest.raises(VersionException, match="Cannot find setup.py"):
+            version_parsers.get_current_version_parts()
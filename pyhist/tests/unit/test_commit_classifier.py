@@ -0,0 +1,52 @@
+from pyhist.versioning.commit_classifier import CommitClassifier
+from pyhist.versioning.commit_type import CommitType
+
+
+class TestCommitClassifier:
+    def test_classify_ScopedFeature_ScopeParsed(self):
+        classification = CommitClassifier().classify("feat(api): Add endpoint")
+
+        assert classification.commit_type == CommitType.Feature
+        assert classification.scope == "api"
+        assert not classification.is_breaking
+
+    def test_classify_BreakingMarker_BreakingChange(self):
+        classification = CommitClassifier().classify("refactor(core)!: Drop API")
+
+        assert classification.commit_type == CommitType.Refactor
+        assert classification.scope == "core"
+        assert classification.is_breaking
+
+    def test_classify_BreakingFooter_BreakingChange(self):
+        classification = CommitClassifier().classify(
+            "fix: Rename flag\n\nBREAKING CHANGE: --old is removed"
+        )
+
+        assert classification.commit_type == CommitType.Fix
+        assert classification.is_breaking
+
+    def test_classify_PrefixedWord_MatchedAsPrefix(self):
+        classification = CommitClassifier().classify("feature: Old style message")
+
+        assert classification.commit_type == CommitType.Feature
+        assert classification.scope is None
+
+    def test_classify_NoSemanticPrefix_NoCommitType(self):
+        classification = CommitClassifier().classify("Initial commit")
+
+        assert classification.commit_type is None
+        assert not classification.is_breaking
+
+    def test_get_type_code_SemanticAndPlainMessages_TypeCodesReturned(self):
+        # arrange
+        classifier = CommitClassifier()
+
+        # act
+        feature_code = classifier.get_type_code("feat: Message is parsed")
+        fix_code = classifier.get_type_code("fix: Message is parsed")
+        unknown_code = classifier.get_type_code("Initial commit")
+
+        # assert
+        assert feature_code == CommitType.Feature.code
+        assert fix_code == CommitType.Fix.code
+        assert unknown_code == 0
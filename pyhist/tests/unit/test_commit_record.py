@@ -0,0 +1,65 @@
+import pickle
+import tracemalloc
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.versioning.commit_type import CommitType
+
+
+class TestCommitRecord:
+    def test_init_FeatureCommit_FieldsAreUnpacked(self):
+        # act
+        record = self.create_record(message="feat: Add feature\n\nLong description")
+
+        # assert
+        assert record.hexsha == "ab" * 20
+        assert record.committed_date == 1577914200
+        assert record.committer_tz_offset == -7200
+        assert record.commit_type == CommitType.Feature
+        assert record.subject == "feat: Add feature"
+        assert record.body == "Long description"
+        assert str(record.committed_datetime) == "2020-01-01 23:30:00+02:00"
+
+    def test_eq_SameCommitCreatedTwice_RecordsAreEqual(self):
+        # act
+        record = self.create_record(message="fix: Fix bug\n")
+        same_record = self.create_record(message="fix: Fix bug\n")
+
+        # assert
+        assert record == same_record
+        assert hash(record) == hash(same_record)
+        assert record != self.create_record(message="fix: Other bug\n")
+
+    def test_pickle_RecordPickled_MessageIsKept(self):
+        # arrange
+        record = self.create_record(message="docs: Update readme\n")
+
+        # act
+        unpickled_record = pickle.loads(pickle.dumps(record))
+
+        # assert
+        assert unpickled_record == record
+        assert unpickled_record.message == "docs: Update readme\n"
+
+    def test_del_RecordsDeleted_MessagesAreFreed(self):
+        # arrange
+        messages = [f"fix: Fix bug {index}\n" * 10 for index in range(1000)]
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+
+        # act
+        records = [self.create_record(message=message) for message in messages]
+        del records
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # assert
+        assert after - before < 1000
+
+    @classmethod
+    def create_record(cls, message: str) -> CommitRecord:
+        return CommitRecord(
+            hexsha="ab" * 20,
+            message=message,
+            committed_date=1577914200,
+            committer_tz_offset=-7200,
+        )
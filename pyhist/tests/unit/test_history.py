@@ -0,0 +1,112 @@
+from typing import List
+
+from pyhist.history.commit_record import CommitRecord
+from pyhist.history.history import History
+from pyhist.versioning.version import Version
+
+
+class TestHistory:
+    def test_add_commit_ThreeCommitsAdded_NewestCommitFirst(self):
+        # arrange
+        history = History()
+        commits = self.create_commits(ids=["1", "2", "3"])
+
+        # act
+        for commit in commits:
+            history.add_commit(commit)
+
+        # assert
+        assert [item.commit for item in history.pyhist_items] == commits[::-1]
+        assert history.pyhist_items[0].commit == commits[2]
+        assert history.pyhist_items[-1].commit == commits[0]
+
+    def test_add_version_VersionAddedAfterCommits_VersionIsFirst(self):
+        # arrange
+        history = History()
+        version = Version().create_from_str_version("0.1.0")
+
+        # act
+        for commit in self.create_commits(ids=["1", "2"]):
+            history.add_commit(commit)
+        history.add_version(version)
+
+        # assert
+        assert history.pyhist_items[0].version == version
+        assert history.get_last_version() == version
+        assert len(history.pyhist_items) == 3
+
+    def test_remove_commits_AdjacentCommitsRemoved_RemainingCommitsKept(self):
+        # arrange
+        history = History()
+        commits = self.create_commits(ids=["1", "2", "3", "4"])
+        for commit in commits:
+            history.add_commit(commit)
+
+        # act
+        history.remove_commits(commits[1:3])
+
+        # assert
+        assert [item.commit for item in history.pyhist_items] == [
+            commits[3],
+            commits[0],
+        ]
+        assert not history.has_commit(commits[1].hexsha)
+        assert not history.has_commit(commits[2].hexsha)
+        assert history.has_commit(commits[3].hexsha)
+
+    def test_remove_commit_CommitRemovedAndAddedAgain_CommitIsFirst(self):
+        # arrange
+        history = History()
+        commits = self.create_commits(ids=["1", "2"])
+        for commit in commits:
+            history.add_commit(commit)
+
+        # act
+        history.remove_commit(commits[0])
+        history.add_commit(commits[0])
+
+        # assert
+        assert [item.commit for item in history.pyhist_items] == commits
+
+    def test_remove_version_EqualVersionParts_VersionRemoved(self):
+        # arrange
+        history = History()
+        history.add_commit(self.create_commits(ids=["1"])[0])
+        history.add_version(Version().create_from_str_version("0.1.0"))
+
+        # act
+        history.remove_version(Version().create_from_str_version("0.1.0"))
+
+        # assert
+        assert history.get_last_version() is None
+        assert len(history.pyhist_items) == 1
+
+    def test_get_last_version_LastVersionRemoved_PreviousVersionReturned(self):
+        # arrange
+        history = History()
+        first_version = Version().create_from_str_version("0.1.0")
+        last_version = Version().create_from_str_version("0.2.0")
+        history.add_version(first_version)
+        history.add_commit(self.create_commits(ids=["1"])[0])
+        history.add_version(last_version)
+
+        # act
+        history.remove_version(last_version)
+
+        # assert
+        assert history.get_last_version() == first_version
+        assert [item.version for item in history.get_version_items()] == [
+            first_version
+        ]
+
+    @classmethod
+    def create_commits(cls, ids: List[str]) -> List[CommitRecord]:
+        return [
+            CommitRecord(
+                hexsha=commit_id * 40,
+                message=f"fix: commit {commit_id}\n",
+                committed_date=1600000000,
+                committer_tz_offset=0,
+            )
+            for commit_id in ids
+        ]
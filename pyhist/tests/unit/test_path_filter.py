@@ -0,0 +1,34 @@
+from pyhist.history.path_filter import PathFilter
+
+
+class TestPathFilter:
+    def test_matches_NoPatterns_EveryPathMatches(self):
+        path_filter = PathFilter()
+
+        assert path_filter.matches("docs/index.md")
+        assert path_filter.matches("setup.py")
+
+    def test_matches_IncludePattern_OnlyIncludedPathsMatch(self):
+        path_filter = PathFilter(include=["src/*", "setup.py"])
+
+        assert path_filter.matches("src/package/main.py")
+        assert path_filter.matches("setup.py")
+        assert not path_filter.matches("docs/index.md")
+
+    def test_matches_ExcludedFolder_PathsInsideDoNotMatch(self):
+        path_filter = PathFilter(include=["*.py"], exclude=["tests/", "*.md"])
+
+        assert path_filter.matches("package/main.py")
+        assert not path_filter.matches("tests/unit/test_main.py")
+        assert not path_filter.matches("README.md")
+
+    def test_is_relevant_OneRelevantPath_CommitIsRelevant(self):
+        path_filter = PathFilter(exclude=["docs/*", ".github/*"])
+
+        assert path_filter.is_relevant(["docs/index.md", "package/main.py"])
+        assert not path_filter.is_relevant(["docs/index.md", ".github/ci.yml"])
+
+    def test_is_relevant_NoPaths_CommitIsRelevant(self):
+        path_filter = PathFilter(include=["src/*"])
+
+        assert path_filter.is_relevant([])
@@ -1,8 +1,7 @@
 from typing import List
-from unittest.mock import patch, MagicMock, Mock
-
-from git import Commit
+from unittest.mock import patch, MagicMock
 
+from pyhist.history.commit_record import CommitRecord
 from pyhist.history.git_history import GitHistory
 from pyhist.history.history import History
 from pyhist.history.pyhist_item import PyHistItem
@@ -46,6 +45,35 @@ class TestPyHist:
             assert patch_get_current_version_parts.called
             assert git_history.add_initial_commit.called_once_with(version="0.0.1")
 
+    def test_setup_DryRun_NoCommitIsCreated(self):
+        # arrange
+        git_history = MagicMock()
+        history = MagicMock()
+        setup_parser = MagicMock()
+        writer = MagicMock()
+
+        pyhist = PyHist(
+            git_history=git_history,
+            history=history,
+            semantic_versioning=MagicMock(),
+            changelog_generator=MagicMock(),
+            setup_parser=setup_parser,
+            writer=writer,
+            dry_run=True,
+        )
+
+        # act
+        with patch.object(history, "is_initialized", return_value=False), patch.object(
+            setup_parser, "get_current_version_parts", return_value=(0, 0, 1)
+        ):
+            pyhist.setup()
+
+        # assert
+        assert history.save_history.called
+        assert writer.diff.called
+        assert not git_history.add_initial_commit.called
+        assert not git_history.save_commit_cache.called
+
     def test_setup_WithPreviousCommits_PreviousCommitsAdded(self):
         # arrange
         git_history = MagicMock()
@@ -158,14 +186,14 @@ class TestPyHist:
         )
 
         history = History()
-        history.pyhist_items = [
+        pyhist_items = [
             PyHistItem(commit=commit, version=None, is_version=False)
             for commit in cls.build_commits(
                 commits=pyhist_commits, messages=pyhist_commits_messages
             )
         ]
         if current_version is not None:
-            history.pyhist_items.insert(
+            pyhist_items.insert(
                 0,
                 PyHistItem(
                     commit=None,
@@ -173,6 +201,7 @@ class TestPyHist:
                     is_version=False,
                 ),
             )
+        history.pyhist_items = pyhist_items
 
         setup_parser = SetupParser()
         current_version_parts = (
@@ -222,8 +251,15 @@ class TestPyHist:
         assert patch_persist_version.called_once_with(version=expected_version)
 
     @classmethod
-    def build_commits(cls, commits: List[str], messages: List[str]) -> List[Commit]:
+    def build_commits(
+        cls, commits: List[str], messages: List[str]
+    ) -> List[CommitRecord]:
         return [
-            Commit(repo=Mock(), binsha=commit, message=message)
+            CommitRecord(
+                hexsha=commit.hex(),
+                message=message,
+                committed_date=1600000000,
+                committer_tz_offset=0,
+            )
             for commit, message in zip(commits, messages)
         ]
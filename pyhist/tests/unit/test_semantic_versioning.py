@@ -1,10 +1,11 @@
-from typing import List
-from unittest.mock import MagicMock, Mock
-
-from git import Commit
+import random
+from typing import List, Optional
+from unittest.mock import MagicMock
 
+from pyhist.history.commit_record import CommitRecord
 from pyhist.history.history import History
 from pyhist.history.git_history import GitHistory
+from pyhist.versioning.commit_type import CommitType
 from pyhist.versioning.semantic_versioning import SemanticVersioning
 from pyhist.versioning.version import Version
 
@@ -91,11 +92,83 @@ class TestSemanticVersioning:
             expected_version=Version().create_from_str_version("0.1.0"),
         )
 
+    def test_update_version_RandomChanges_SameVersionAsApplyingEachCommit(self):
+        commit_types = list(CommitType) + [None]
+        rng = random.Random(10)
+
+        for _ in range(300):
+            # arrange
+            added_commits = self.create_typed_commits(
+                [rng.choice(commit_types) for _ in range(rng.randint(0, 12))], rng
+            )
+            removed_commits = self.create_typed_commits(
+                [rng.choice(commit_types) for _ in range(rng.randint(0, 6))], rng
+            )
+            history = History()
+            history.add_version(Version().create_from_str_version("1.4.2"))
+            semantic_versioning = SemanticVersioning(
+                git_history=GitHistory(), history=history
+            )
+            semantic_versioning.version = Version().create_from_str_version("3.5.4")
+
+            # act
+            semantic_versioning.update_version(
+                added_commits=added_commits, removed_commits=removed_commits
+            )
+
+            # assert
+            expected_version = self.apply_each_commit(
+                version=Version().create_from_str_version("3.5.4"),
+                last_version=Version().create_from_str_version("1.4.2"),
+                added_commits=added_commits,
+                removed_commits=removed_commits,
+            )
+            assert (
+                semantic_versioning.version.get_version()
+                == expected_version.get_version()
+            )
+
+    @staticmethod
+    def apply_each_commit(
+        version: Version,
+        last_version: Version,
+        added_commits: List[CommitRecord],
+        removed_commits: List[CommitRecord],
+    ) -> Version:
+        patch_types = [
+            CommitType.Fix,
+            CommitType.Refactor,
+            CommitType.Docs,
+            CommitType.Test,
+            CommitType.Style,
+            CommitType.Chore,
+            CommitType.Performance,
+        ]
+
+        for commit in removed_commits:
+            if commit.commit_type in [CommitType.Release, CommitType.Versioning]:
+                version.create_from_version(version=last_version)
+            elif commit.commit_type == CommitType.Feature:
+                version.decrease_minor()
+            elif commit.commit_type in patch_types:
+                version.decrease_patch()
+
+        for commit in added_commits:
+            if commit.commit_type == CommitType.Versioning:
+                pass
+            elif commit.commit_type == CommitType.Feature:
+                version.increase_minor()
+            elif commit.commit_type in patch_types:
+                version.increase_patch()
+
+        version.update()
+        return version
+
     @staticmethod
     def assert_version_update(
         current_version: Version,
-        added_commits: List[Commit],
-        removed_commits: List[Commit],
+        added_commits: List[CommitRecord],
+        removed_commits: List[CommitRecord],
         expected_version: Version,
     ):
         git_history = GitHistory()
@@ -118,8 +191,31 @@ class TestSemanticVersioning:
         )
 
     @classmethod
-    def create_commits(cls, ids: List[str], messages: List[str]) -> List[Commit]:
+    def create_commits(
+        cls, ids: List[str], messages: List[str]
+    ) -> List[CommitRecord]:
         return [
-            Commit(repo=Mock(), binsha=commit, message=message)
+            CommitRecord(
+                hexsha=commit.hex(),
+                message=message,
+                committed_date=1600000000,
+                committer_tz_offset=0,
+            )
             for commit, message in zip(ids, messages)
         ]
+
+    @classmethod
+    def create_typed_commits(
+        cls, commit_types: List[Optional[CommitType]], rng: random.Random
+    ) -> List[CommitRecord]:
+        return [
+            CommitRecord(
+                hexsha=f"{rng.getrandbits(160):040x}",
+                message=f"{commit_type.value}: message"
+                if commit_type is not None
+                else "Initial commit",
+                committed_date=1600000000,
+                committer_tz_offset=0,
+            )
+            for commit_type in commit_types
+        ]
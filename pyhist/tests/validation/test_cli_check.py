@@ -0,0 +1,122 @@
+import os
+from typing import List
+
+from click.testing import CliRunner, Result
+from git import Repo
+
+from pyhist.cli import main as cli
+from pyhist.tests.validation.base_validation_test import BaseValidationTest
+
+
+class TestCliCheck(BaseValidationTest):
+    def test_check_NoCommitsAfterInit_NoReleaseNeeded(self):
+        # setup
+        CliRunner().invoke(cli, ["--init"])
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check"])
+
+        # assert
+        assert check_result.exit_code == 0
+
+    def test_check_FeatureAdded_ReleaseNeeded(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+
+        test_file = "test_file"
+        os.system(f"touch {test_file}")
+        repo.git.add(test_file)
+        repo.git.commit("-m", "feat: Created test file")
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check"])
+
+        # assert
+        assert check_result.exit_code == 1
+
+    def test_check_FeatureAddedAndUpdated_NoReleaseNeeded(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+
+        test_file = "test_file"
+        os.system(f"touch {test_file}")
+        repo.git.add(test_file)
+        repo.git.commit("-m", "feat: Created test file")
+        CliRunner().invoke(cli, ["--update"])
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check"])
+
+        # assert
+        assert check_result.exit_code == 0
+        assert repo.head.commit.message.startswith("versioning")
+
+    def test_check_RecordedCommitRewritten_ReleaseNeeded(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+
+        test_file = "test_file"
+        os.system(f"touch {test_file}")
+        repo.git.add(test_file)
+        repo.git.commit("-m", "feat: Created test file")
+        CliRunner().invoke(cli, ["--update"])
+        versioning_commit = repo.head.commit.hexsha
+        repo.git.reset("--hard", "HEAD~2")
+        repo.git.checkout(versioning_commit, "--", self.history_route)
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check"])
+
+        # assert
+        assert check_result.exit_code == 1
+        assert "rewritten" in check_result.output
+
+    def test_check_ThreeCommitsBeforeInit_NoReleaseNeeded(self):
+        # setup
+        repo = Repo(self.git_folder)
+        self.commit_files(repo, ["first_file", "second_file", "third_file"])
+        CliRunner().invoke(cli, ["--init"])
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check"])
+
+        # assert
+        assert check_result.exit_code == 0
+
+    def test_check_TwoCommitsUpdated_NoReleaseNeeded(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+        self.commit_files(repo, ["first_file", "second_file"])
+        CliRunner().invoke(cli, ["--update"])
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check"])
+
+        # assert
+        assert check_result.exit_code == 0
+
+    def test_check_TwoCommitsUpdatedAndOneAdded_OneNewCommit(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+        self.commit_files(repo, ["first_file", "second_file"])
+        CliRunner().invoke(cli, ["--update"])
+        self.commit_files(repo, ["third_file"])
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check"])
+
+        # assert
+        assert check_result.exit_code == 1
+        assert "1 new commits" in check_result.output
+
+    @staticmethod
+    def commit_files(repo: Repo, files: List[str]):
+        for test_file in files:
+            os.system(f"touch {test_file}")
+            repo.git.add(test_file)
+            repo.git.commit("-m", f"fix: Created {test_file}")
@@ -0,0 +1,70 @@
+import os
+
+from click.testing import CliRunner, Result
+from git import Repo
+
+from pyhist.cli import main as cli
+from pyhist.io.setup_parser import SetupParser
+from pyhist.tests.validation.base_validation_test import BaseValidationTest
+
+
+class TestCliDryRun(BaseValidationTest):
+    changelog_route = "CHANGELOG.md"
+
+    @classmethod
+    def read(cls, route: str) -> bytes:
+        with open(route, "rb") as file:
+            return file.read()
+
+    def test_update_DryRunWithFeature_VersionPrintedAndNothingWritten(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+
+        test_file = "test_file"
+        os.system(f"touch {test_file}")
+        repo.git.add(test_file)
+        repo.git.commit("-m", "feat: Created test file")
+
+        head = repo.head.commit.hexsha
+        history_content = self.read(self.history_route)
+        setup_content = self.read(self.setup_file_route)
+
+        # act
+        dry_run_result: Result = CliRunner().invoke(cli, ["--update", "--dry-run"])
+
+        # assert
+        assert dry_run_result.exit_code == 0
+        assert "Next version: 0.1.0" in dry_run_result.output
+        assert f"+++ b/{self.changelog_route}" in dry_run_result.output
+        assert "+- **feat**:  Created test file" in dry_run_result.output
+        assert repo.head.commit.hexsha == head
+        assert not repo.is_dirty()
+        assert not os.path.exists(self.changelog_route)
+        assert self.read(self.history_route) == history_content
+        assert self.read(self.setup_file_route) == setup_content
+
+    def test_major_DryRunAfterUpdate_ChangelogDiffOnlyAddsNewVersion(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+
+        test_file = "test_file"
+        os.system(f"touch {test_file}")
+        repo.git.add(test_file)
+        repo.git.commit("-m", "feat: Created test file")
+        CliRunner().invoke(cli, ["--update"])
+
+        changelog_content = self.read(self.changelog_route)
+
+        # act
+        dry_run_result: Result = CliRunner().invoke(cli, ["--major", "--dry-run"])
+
+        # assert
+        assert dry_run_result.exit_code == 0
+        assert "Next version: 1.0.0" in dry_run_result.output
+        assert "+## 1.0.0" in dry_run_result.output
+        assert "-## 0.1.0" not in dry_run_result.output
+        assert self.read(self.changelog_route) == changelog_content
+        assert SetupParser().get_current_version_parts() == [0, 1, 0]
+        assert repo.head.commit.message.startswith("versioning: Set version to 0.1.0")
@@ -0,0 +1,119 @@
+import os
+import shutil
+
+from click.testing import CliRunner, Result
+from git import Repo
+
+from pyhist.cli import main as cli
+from pyhist.io.pyproject_parser import PyprojectParser
+from pyhist.io.setup_parser import SetupParser
+from pyhist.tests.validation.base_validation_test import BaseValidationTest
+
+
+class TestCliMonorepo(BaseValidationTest):
+    packages_folder = "monorepo_packages"
+    first_package = "monorepo_packages/first"
+    second_package = "monorepo_packages/second"
+
+    @classmethod
+    def setup_method(cls):
+        super().setup_method()
+        os.makedirs(cls.first_package)
+        os.makedirs(cls.second_package)
+        with open(os.path.join(cls.first_package, "setup.py"), "w") as file:
+            file.write("from setuptools import setup\nsetup(version='0.0.0')\n")
+        with open(os.path.join(cls.second_package, "pyproject.toml"), "w") as file:
+            file.write('[project]\nname = "second"\nversion = "1.0.0"\n')
+
+        repo = Repo(cls.git_folder)
+        repo.git.add(cls.packages_folder)
+        repo.git.commit("-m", "chore: Add packages")
+
+    @classmethod
+    def teardown_method(cls):
+        shutil.rmtree(cls.packages_folder, ignore_errors=True)
+        super().teardown_method()
+
+    @classmethod
+    def commit_file(cls, repo: Repo, route: str, message: str):
+        with open(route, "a") as file:
+            file.write("text\n")
+        repo.git.add(route)
+        repo.git.commit("-m", message)
+
+    def test_update_CommitsInBothPackages_OneVersioningCommitForAll(self):
+        # setup
+        repo = Repo(self.git_folder)
+        init_result: Result = CliRunner().invoke(cli, ["--init", "--monorepo"])
+        init_commit = repo.head.commit
+
+        self.commit_file(
+            repo, os.path.join(self.first_package, "main.py"), "feat: Add main"
+        )
+        self.commit_file(
+            repo, os.path.join(self.second_package, "cli.py"), "fix: Fix cli"
+        )
+
+        # act
+        update_result: Result = CliRunner().invoke(cli, ["--update", "--monorepo"])
+        update_commit = repo.head.commit
+        second_update_result: Result = CliRunner().invoke(
+            cli, ["--update", "--monorepo"]
+        )
+
+        # assert
+        assert init_result.exit_code == 0
+        assert init_commit.message.startswith(
+            "versioning: Init pyhist in monorepo_packages/first with version 0.0.0, "
+            "monorepo_packages/second with version 1.0.0"
+        )
+        assert update_result.exit_code == 0
+        assert update_commit.message.startswith(
+            "versioning: Set version of monorepo_packages/first to 0.1.0, "
+            "monorepo_packages/second to 1.0.1"
+        )
+        assert sorted(update_commit.stats.files) == sorted(
+            [
+                f"{self.first_package}/.pyhist",
+                f"{self.first_package}/CHANGELOG.md",
+                f"{self.first_package}/setup.py",
+                f"{self.second_package}/.pyhist",
+                f"{self.second_package}/CHANGELOG.md",
+                f"{self.second_package}/pyproject.toml",
+            ]
+        )
+        assert second_update_result.exit_code == 0
+        assert repo.head.commit == update_commit
+        assert not repo.is_dirty()
+
+        first_parser = SetupParser(os.path.join(self.first_package, "setup.py"))
+        second_parser = PyprojectParser(
+            os.path.join(self.second_package, "pyproject.toml")
+        )
+        assert first_parser.get_current_version_parts() == [0, 1, 0]
+        assert second_parser.get_current_version_parts() == [1, 0, 1]
+
+    def test_update_DryRunWithCommitInOnePackage_NothingWritten(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init", "--monorepo"])
+        self.commit_file(
+            repo, os.path.join(self.second_package, "cli.py"), "feat: Add cli"
+        )
+        head = repo.head.commit
+
+        # act
+        dry_run_result: Result = CliRunner().invoke(
+            cli, ["--update", "--monorepo", "--dry-run"]
+        )
+
+        # assert
+        assert dry_run_result.exit_code == 0
+        assert "[monorepo_packages/first]\nNo version changes" in dry_run_result.output
+        assert "[monorepo_packages/second]\nNext version: 1.1.0" in (
+            dry_run_result.output
+        )
+        assert "+- **feat**:  Add cli" in dry_run_result.output
+        assert repo.head.commit == head
+        assert not repo.is_dirty()
+        assert not os.path.exists(os.path.join(self.second_package, "CHANGELOG.md"))
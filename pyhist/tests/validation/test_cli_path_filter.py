@@ -0,0 +1,55 @@
+import os
+
+from click.testing import CliRunner, Result
+from git import Repo
+
+from pyhist.cli import main as cli
+from pyhist.io.setup_parser import SetupParser
+from pyhist.tests.validation.base_validation_test import BaseValidationTest
+
+
+class TestCliPathFilter(BaseValidationTest):
+    def test_update_ExcludedDocsCommit_VersionNotChanged(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+        init_commit = repo.head.commit
+
+        docs_file = "docs_file.md"
+        os.system(f"touch {docs_file}")
+        repo.git.add(docs_file)
+        repo.git.commit("-m", "feat: Document the package")
+        docs_commit = repo.head.commit
+
+        # act
+        check_result: Result = CliRunner().invoke(cli, ["--check", "--exclude", "*.md"])
+        update_result: Result = CliRunner().invoke(
+            cli, ["--update", "--exclude", "*.md"]
+        )
+
+        # assert
+        assert init_commit.message.startswith("versioning: Init pyhist")
+        assert check_result.exit_code == 0
+        assert update_result.exit_code == 0
+        assert repo.head.commit == docs_commit
+        assert SetupParser().get_current_version_parts() == [0, 0, 0]
+
+    def test_update_IncludedFileCommit_VersionChanged(self):
+        # setup
+        repo = Repo(self.git_folder)
+        CliRunner().invoke(cli, ["--init"])
+
+        code_file = "code_file"
+        os.system(f"touch {code_file}")
+        repo.git.add(code_file)
+        repo.git.commit("-m", "feat: Add code")
+
+        # act
+        update_result: Result = CliRunner().invoke(
+            cli, ["--update", "--include", "code_*", "--exclude", "*.md"]
+        )
+
+        # assert
+        assert update_result.exit_code == 0
+        assert repo.head.commit.message.startswith("versioning: Set version to 0.1.0")
+        assert SetupParser().get_current_version_parts() == [0, 1, 0]
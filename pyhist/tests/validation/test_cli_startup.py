@@ -0,0 +1,61 @@
+import os
+import re
+import subprocess
+import sys
+
+import pyhist
+
+
+class TestCliStartup:
+    # Cumulative import time of pyhist.cli, in microseconds. Importing the cli
+    # must stay cheap, because pyhist runs in pre-commit hooks on every commit
+    IMPORT_TIME_BUDGET = 100_000
+    RUNS = 5
+
+    @classmethod
+    def run_python(cls, *arguments: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, *arguments],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+            # Run from the project root, so pyhist resolves to the package
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(pyhist.__file__))),
+        )
+
+    @classmethod
+    def get_import_time(cls) -> int:
+        result = cls.run_python("-X", "importtime", "-c", "import pyhist.cli")
+        match = re.search(r"\|\s*(\d+) \| pyhist\.cli$", result.stderr, re.MULTILINE)
+        return int(match.group(1))
+
+    def test_import_CliModule_WithinImportTimeBudget(self):
+        # act
+        import_time = min(self.get_import_time() for _ in range(self.RUNS))
+
+        # assert
+        assert import_time < self.IMPORT_TIME_BUDGET
+
+    def test_import_CliModule_GitPythonIsNotImported(self):
+        # act
+        result = self.run_python(
+            "-c", "import sys, pyhist.cli; print('git' in sys.modules)"
+        )
+
+        # assert
+        assert result.stdout.strip() == "False"
+
+    def test_main_Help_GitPythonIsNotImported(self):
+        # act
+        result = self.run_python(
+            "-c",
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from pyhist.cli import main\n"
+            "CliRunner().invoke(main, ['--help'])\n"
+            "print('git' in sys.modules)",
+        )
+
+        # assert
+        assert result.stdout.strip() == "False"
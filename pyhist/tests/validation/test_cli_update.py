@@ -1,4 +1,5 @@
 import os
+import shutil
 from typing import List
 
 from click.testing import CliRunner, Result
@@ -7,6 +8,7 @@ from git import Repo
 from pyhist.cli import main as cli
 from pyhist.history import History
 from pyhist.io.setup_parser import SetupParser
+from pyhist.io.version_module_parser import VersionModuleParser
 from pyhist.tests.validation.base_validation_test import BaseValidationTest
 
 
@@ -135,6 +137,44 @@ class TestCliUpdate(BaseValidationTest):
         assert ".pyhist" not in repo.untracked_files
         assert "CHANGELOG.md" not in repo.untracked_files
 
+    def test_update_VersionModule_ModuleVersionIsUpdatedAndCommitted(self):
+        # setup
+        repo = Repo(self.git_folder)
+        # setup.py declares the "package" package
+        module_folder = "package"
+        module_route = f"{module_folder}/__init__.py"
+        os.makedirs(module_folder)
+        with open(module_route, "w") as module_file:
+            module_file.write('__version__ = "0.0.0"\n')
+        repo.git.add(module_route)
+        repo.git.commit("-m", "chore: Add package module")
+
+        try:
+            # act
+            # init pyhist
+            init_result: Result = CliRunner().invoke(cli, ["--init"])
+
+            self.assert_init(["0.0.0"], init_result)
+
+            # create and commit test file
+            test_file = "test_file"
+            os.system(f"touch {test_file}")
+            repo.git.add(test_file)
+            repo.git.commit("-m", "feat: Created test file")
+
+            # execute update
+            update_result: Result = CliRunner().invoke(cli, ["--update"])
+
+            self.asserts(["0.1.0", "0.0.0"], update_result, repo)
+            assert VersionModuleParser(module_route).get_current_version_parts() == [
+                0,
+                1,
+                0,
+            ]
+            assert not repo.is_dirty()
+        finally:
+            shutil.rmtree(module_folder)
+
     @staticmethod
     def asserts(
         expected_versions: List[str], result: Result, repo: Repo,
@@ -181,3 +221,92 @@ class TestCliUpdate(BaseValidationTest):
         assert [
             item.version.get_version() for item in history.get_version_items()
         ] == expected_versions
+
+    def test_update_AsyncGitAddFeature_Version010IsSet(self):
+        # setup
+        repo = Repo(self.git_folder)
+
+        # act
+        # init pyhist
+        init_result: Result = CliRunner().invoke(cli, ["--init", "--async-git"])
+
+        self.assert_init(["0.0.0"], init_result)
+
+        # create and commit test file
+        test_file = "test_file"
+        os.system(f"touch {test_file}")
+        repo.git.add(test_file)
+        repo.git.commit("-m", "feat: Created test file")
+
+        # execute update
+        update_result: Result = CliRunner().invoke(cli, ["--update", "--async-git"])
+
+        self.asserts(["0.1.0", "0.0.0"], update_result, repo)
+
+    def test_update_RebaseDropsOlderCommitOfRelease_DroppedCommitIsRemoved(self):
+        # setup
+        repo = Repo(self.git_folder)
+        init_result: Result = CliRunner().invoke(cli, ["--init"])
+        self.assert_init(["0.0.0"], init_result)
+
+        for commit_type, test_file in [("feat", "six"), ("fix", "seven")]:
+            os.system(f"touch {test_file}")
+            repo.git.add(test_file)
+            repo.git.commit("-m", f"{commit_type}: Created {test_file} file")
+        dropped_commit_id = repo.head.commit.hexsha
+
+        update_result: Result = CliRunner().invoke(cli, ["--update"])
+        self.asserts(["0.1.0", "0.0.0"], update_result, repo)
+
+        # act
+        # drop the fix while keeping the versioning commit
+        repo.git.rebase("--onto", "HEAD~2", "HEAD~1")
+        os.system("touch eight")
+        repo.git.add("eight")
+        repo.git.commit("-m", "fix: Created eight file")
+        added_commit_id = repo.head.commit.hexsha
+
+        update_result = CliRunner().invoke(cli, ["--update"])
+
+        # assert
+        assert update_result.exit_code == 0
+        history = History()
+        history.load_history()
+        assert not history.has_commit(dropped_commit_id)
+        assert history.has_commit(added_commit_id)
+        assert history.get_head_commit_id() == added_commit_id
+
+    def test_update_VersionNotPersisted_HistoryIsNotSaved(self):
+        # setup
+        repo = Repo(self.git_folder)
+        init_result: Result = CliRunner().invoke(cli, ["--init"])
+        self.assert_init(["0.0.0"], init_result)
+
+        with open(self.setup_file_route) as setup_file:
+            setup_content = setup_file.read()
+        os.system("touch test_file")
+        repo.git.add("test_file")
+        repo.git.commit("-m", "fix: Created test file")
+        with open(self.setup_file_route, "w") as setup_file:
+            setup_file.write(
+                setup_content.replace("version='0.0.0'", "version=VERSION")
+            )
+        repo.git.add(self.setup_file_route)
+        repo.git.commit("-m", "chore: Move version")
+        moved_commit_id = repo.head.commit.hexsha
+
+        # act
+        failed_result: Result = CliRunner().invoke(cli, ["--update"])
+        failed_history = History()
+        failed_history.load_history()
+
+        with open(self.setup_file_route, "w") as setup_file:
+            setup_file.write(setup_content)
+        repo.git.add(self.setup_file_route)
+        repo.git.commit("-m", "fix: Restore version")
+        update_result: Result = CliRunner().invoke(cli, ["--update"])
+
+        # assert
+        assert failed_result.exit_code != 0
+        assert not failed_history.has_commit(moved_commit_id)
+        self.asserts(["0.0.3", "0.0.0"], update_result, repo)
@@ -0,0 +1,50 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from pyhist.versioning.commit_type import CommitType
+
+
+@dataclass(frozen=True)
+class CommitClassification:
+    commit_type: Optional[CommitType]
+    scope: Optional[str] = None
+    is_breaking: bool = False
+
+
+class CommitClassifier:
+    # Types are matched as message prefixes, longest first. A conventional
+    # commit scope and breaking change marker are parsed when a colon follows
+    _TYPES = "|".join(
+        re.escape(commit_type.value)
+        for commit_type in sorted(CommitType, key=lambda item: -len(item.value))
+    )
+    _PATTERN = re.compile(
+        rf"(?P<type>{_TYPES})(?:(?:\((?P<scope>[^()\n]*)\))?(?P<breaking>!)?:)?"
+    )
+    _BREAKING_FOOTER = re.compile(r"^BREAKING[ -]CHANGE:", re.MULTILINE)
+
+    def classify(self, message: str) -> CommitClassification:
+        match = self._PATTERN.match(message)
+        if match is None:
+            return CommitClassification(commit_type=None)
+
+        return CommitClassification(
+            commit_type=CommitType(match.group("type")),
+            scope=match.group("scope"),
+            is_breaking=match.group("breaking") is not None
+            or self._BREAKING_FOOTER.search(message) is not None,
+        )
+
+    def get_commit_type(self, message: str) -> Optional[CommitType]:
+        match = self._PATTERN.match(message)
+        return CommitType(match.group("type")) if match is not None else None
+
+    def get_type_code(self, message: str) -> int:
+        commit_type = self.get_commit_type(message)
+        return commit_type.code if commit_type is not None else 0
+
+
+# Stateless, so it is shared by every commit record. Commits already seen are
+# not classified again because their type code is kept in the commit cache
+COMMIT_CLASSIFIER = CommitClassifier()
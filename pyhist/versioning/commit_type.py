@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional
 
 
 class CommitType(Enum):
@@ -12,3 +13,18 @@ class CommitType(Enum):
     Style = "style"
     Test = "test"
     Versioning = "versioning"
+
+    @property
+    def code(self) -> int:
+        return _COMMIT_TYPE_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> Optional["CommitType"]:
+        return _COMMIT_TYPES[code - 1] if code > 0 else None
+
+
+# Codes are persisted in .pyhist, so new types must be appended at the end
+_COMMIT_TYPES = list(CommitType)
+_COMMIT_TYPE_CODES = {
+    commit_type: code for code, commit_type in enumerate(_COMMIT_TYPES, start=1)
+}
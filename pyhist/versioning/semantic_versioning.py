@@ -1,15 +1,51 @@
 import re
 from typing import List
 
-from git import Commit
-
+from pyhist.history.commit_cache import CacheEntry
+from pyhist.history.commit_record import CommitRecord
 from pyhist.history.history import History
 from pyhist.history.git_history import GitHistory
+from pyhist.versioning.commit_classifier import COMMIT_CLASSIFIER
 from pyhist.versioning.commit_type import CommitType
 from pyhist.versioning.version import Version
 
+# Effect of each commit on the version, once type codes are translated
+_NO_CHANGE = b"\x00"
+_PATCH_CHANGE = b"\x01"
+_MINOR_CHANGE = b"\x02"
+_RESET_CHANGE = b"\x03"
+
+_RESET_TYPES = [CommitType.Release, CommitType.Versioning]
+_MINOR_TYPES = [CommitType.Feature]
+_PATCH_TYPES = [
+    CommitType.Fix,
+    CommitType.Refactor,
+    CommitType.Docs,
+    CommitType.Test,
+    CommitType.Style,
+    CommitType.Chore,
+    CommitType.Performance,
+]
+
+
+def _build_change_table(reset_types: List[CommitType]) -> bytes:
+    table = bytearray(_NO_CHANGE * 256)
+    for commit_types, change in [
+        (_PATCH_TYPES, _PATCH_CHANGE),
+        (_MINOR_TYPES, _MINOR_CHANGE),
+        (reset_types, _RESET_CHANGE),
+    ]:
+        for commit_type in commit_types:
+            table[commit_type.code] = change[0]
+
+    return bytes(table)
+
 
 class SemanticVersioning:
+    # Removing a release or versioning commit resets the version to the last one
+    _REMOVED_CHANGES = _build_change_table(reset_types=_RESET_TYPES)
+    _ADDED_CHANGES = _build_change_table(reset_types=[])
+
     def __init__(
         self, git_history: GitHistory, history: History,
     ):
@@ -20,117 +56,67 @@ class SemanticVersioning:
         self.version: Version = None
 
     def update_version(
-        self, added_commits: List[Commit], removed_commits: List[Commit]
+        self, added_commits: List[CommitRecord], removed_commits: List[CommitRecord]
     ) -> None:
-
-        for commit in removed_commits:
-            if self._is_release_commit(commit.message) or self.is_versioning_commit(
-                commit.message
-            ):
-                self.version.create_from_version(
-                    version=self.__history.get_last_version()
-                )
-            elif self._is_minor_change(commit.message):
-                self.version.decrease_minor()
-            elif self._is_patch_change(commit.message):
-                self.version.decrease_patch()
-
-        for commit in added_commits:
-            if self.is_versioning_commit(commit.message):
-                pass
-            elif self._is_minor_change(commit.message):
-                self.version.increase_minor()
-            elif self._is_patch_change(commit.message):
-                self.version.increase_patch()
-
-        self.version.update()
-
-    def generate_release(self) -> None:
-        self.version.increase_major()
-
-    @classmethod
-    def _is_minor_change(cls, commit_message: str) -> bool:
-        return cls._is_feature(commit_message)
-
-    @classmethod
-    def _is_patch_change(cls, commit_message: str) -> bool:
-        return (
-            cls._is_fix(commit_message)
-            or cls._is_refactor(commit_message)
-            or cls._is_docs(commit_message)
-            or cls._is_test(commit_message)
-            or cls._is_style(commit_message)
-            or cls._is_chore(commit_message)
-            or cls._is_performance(commit_message)
-        )
-
-    @classmethod
-    def _is_release_commit(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Release.value
-        )
-
-    @classmethod
-    def is_versioning_commit(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Versioning.value
+        self.update_version_from_codes(
+            added_codes=self._get_type_codes(added_commits),
+            removed_codes=self._get_type_codes(removed_commits),
         )
 
-    @classmethod
-    def _is_feature(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Feature.value
+    def update_version_from_codes(
+        self, added_codes: bytes, removed_codes: bytes
+    ) -> None:
+        # Equivalent to applying every commit in order: only the changes after the
+        # last reset (removed) or the last minor change (added) affect the patch
+        removed_changes = removed_codes.translate(self._REMOVED_CHANGES)
+        last_reset = removed_changes.rfind(_RESET_CHANGE)
+        if last_reset >= 0:
+            self.version.create_from_version(version=self.__history.get_last_version())
+
+        self.version.decrease_minor(
+            removed_changes.count(_MINOR_CHANGE, last_reset + 1)
         )
-
-    @classmethod
-    def _is_fix(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Fix.value
+        self.version.decrease_patch(
+            removed_changes.count(_PATCH_CHANGE, last_reset + 1)
         )
 
-    @classmethod
-    def _is_refactor(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Refactor.value
-        )
+        added_changes = added_codes.translate(self._ADDED_CHANGES)
+        last_minor = added_changes.rfind(_MINOR_CHANGE)
+        if last_minor >= 0:
+            self.version.increase_minor(added_changes.count(_MINOR_CHANGE))
 
-    @classmethod
-    def _is_performance(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Performance.value
-        )
+        self.version.increase_patch(added_changes.count(_PATCH_CHANGE, last_minor + 1))
 
-    @classmethod
-    def _is_docs(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Docs.value
-        )
+        self.version.update()
 
-    @classmethod
-    def _is_test(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Test.value
-        )
+    def generate_release(self) -> None:
+        self.version.increase_major()
 
     @classmethod
-    def _is_chore(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Chore.value
-        )
+    def is_versioning_commit(cls, commit_message: str) -> bool:
+        commit_type = COMMIT_CLASSIFIER.get_commit_type(commit_message)
+        return commit_type is CommitType.Versioning
 
     @classmethod
-    def _is_style(cls, commit_message: str) -> bool:
-        return cls._check_semantic_commit(
-            commit_message, commit_type=CommitType.Style.value
-        )
+    def _get_type_codes(cls, commits: List[CommitRecord]) -> bytes:
+        return bytes(commit.type_code for commit in commits)
 
-    @classmethod
-    def _check_semantic_commit(cls, commit_message: str, commit_type: str) -> bool:
-        return commit_message[: len(commit_type)] == commit_type
+    def parse_version_from_commit(self, commit: CommitRecord) -> Version:
+        commit_cache = self.__git_history.commit_cache
+        cache_entry = commit_cache.get(commit.binsha, commit.committed_date)
+        if cache_entry is not None and cache_entry.version is not None:
+            return Version().create_from_version_parts(*cache_entry.version)
 
-    @classmethod
-    def parse_version_from_commit(cls, commit: Commit) -> Version:
         version_match = re.search(r"(.*)([0-9]\.[0-9]\.[0-9])(.*)", commit.message)
 
         if version_match is not None and version_match.lastindex == 3:
-            return Version().create_from_str_version(version_match[2])
+            version = Version().create_from_str_version(version_match[2])
+            commit_cache.put(
+                commit.binsha,
+                CacheEntry(
+                    type_code=commit.type_code,
+                    version=(version.major, version.minor, version.patch),
+                    committed_date=commit.committed_date,
+                ),
+            )
+            return version
@@ -22,7 +22,7 @@ class Version:
 
     # Constructor
     def create_from_version(self, version: "Version") -> "Version":
-        self.set_version(major=version.major, minor=version.minor, patch=version)
+        self.set_version(major=version.major, minor=version.minor, patch=version.patch)
         return self
 
     # Constructor
@@ -45,8 +45,8 @@ class Version:
     def get_version(self) -> str:
         return f"{self.major}.{self.minor}.{self.patch}"
 
-    def increase_minor(self) -> None:
-        self.__updated_minor += 1
+    def increase_minor(self, count: int = 1) -> None:
+        self.__updated_minor += count
         self.__updated_patch = 0
 
     def increase_major(self) -> None:
@@ -54,14 +54,14 @@ class Version:
         self.__updated_minor = 0
         self.__updated_patch = 0
 
-    def increase_patch(self) -> None:
-        self.__updated_patch += 1
+    def increase_patch(self, count: int = 1) -> None:
+        self.__updated_patch += count
 
-    def decrease_minor(self) -> None:
-        self.__updated_minor -= 1
+    def decrease_minor(self, count: int = 1) -> None:
+        self.__updated_minor -= count
 
-    def decrease_patch(self) -> None:
-        self.__updated_patch -= 1
+    def decrease_patch(self, count: int = 1) -> None:
+        self.__updated_patch -= count
 
     def has_changed(self) -> bool:
         return (
@@ -81,6 +81,12 @@ class Version:
 
             self.__version_timestamp = datetime.utcnow().timestamp()
 
+    def get_timestamp(self) -> Optional[float]:
+        return self.__version_timestamp
+
+    def set_timestamp(self, timestamp: Optional[float]) -> None:
+        self.__version_timestamp = timestamp
+
     def date(self) -> Optional[str]:
         if self.__version_timestamp:
             return datetime.fromtimestamp(self.__version_timestamp).strftime("%Y-%m-%d")